@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_PLATFORM_TYPE
+from .carousel_storage import CarouselStorage
+from .const import CONF_PLATFORM_TYPE, DATA_CAROUSELS, DOMAIN
+from .member_hub import MemberHub
 
 
 # ------------------------------------------------------------------
@@ -26,11 +28,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 # ------------------------------------------------------------------
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Unload a config entry."""
+    """Unload a config entry.
+
+    The member hub shared by the carousels is removed with the last of them.
+    """
     tmp_platform: list[Platform] = [
         Platform.__members__[str(entry.options.get(CONF_PLATFORM_TYPE)).upper()]
     ]
-    return await hass.config_entries.async_unload_platforms(entry, tmp_platform)
+
+    if not await hass.config_entries.async_unload_platforms(entry, tmp_platform):
+        return False
+
+    if not any(
+        other_entry.state is ConfigEntryState.LOADED
+        for other_entry in hass.config_entries.async_entries(DOMAIN)
+        if other_entry.entry_id != entry.entry_id
+    ):
+        MemberHub.async_shutdown(hass)
+
+    return True
+
+
+# ------------------------------------------------------------------
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored carousel state when the config entry is removed."""
+    await CarouselStorage(hass, entry.entry_id).async_remove_settings()
 
 
 # ------------------------------------------------------------------
@@ -45,6 +67,18 @@ async def update_listener(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
 ) -> None:
-    """Reload on config entry update."""
+    """Apply options on config entry update.
+
+    The running carousel is updated in place. It is only reloaded if the platform
+    type changes or no carousel entity is running.
+    """
+
+    carousel = hass.data.get(DATA_CAROUSELS, {}).get(config_entry.entry_id)
+
+    if carousel is None or carousel.platform.domain != config_entry.options.get(
+        CONF_PLATFORM_TYPE
+    ):
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
 
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    await carousel.async_apply_options()
@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from functools import partial
+import heapq
+from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_ENTITY_ID,
-    ATTR_FRIENDLY_NAME,
-    ATTR_ICON,
-    ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STOP,
     MATCH_ALL,
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
+    HassJob,
     HomeAssistant,
     ServiceCall,
     State,
@@ -27,28 +32,40 @@ from homeassistant.helpers import (
     config_validation as cv,
     entity_platform,
     entity_registry as er,
-    icon as ic,
-    issue_registry as ir,
     start,
 )
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
-from homeassistant.helpers.entity import Entity, get_device_class
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.event import (
     EventStateChangedData,
-    async_track_state_change_event,
+    TrackTemplate,
+    TrackTemplateResult,
+    TrackTemplateResultInfo,
+    async_call_later,
+    async_track_point_in_utc_time,
+    async_track_template_result,
 )
-from homeassistant.helpers.template import Template
+from homeassistant.helpers.template import RenderInfo, Template
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
 from .base_entity_info import BaseEntityInfo
+from .carousel_storage import CarouselStorage
 from .const import (
+    CONF_ALIGN_TO_CLOCK,
+    CONF_ATTRIBUTES_EXCLUDE,
+    CONF_ATTRIBUTES_INCLUDE,
+    CONF_ENTITY_IDS,
     CONF_LISTEN_TO_TIMER_TRIGGER,
+    CONF_MIN_WRITE_INTERVAL,
     CONF_RESTART_TIMER,
     CONF_ROTATE_EVERY_MINUTES,
+    CONF_SHOW_IF_FILTER,
     CONF_SHOW_IF_TEMPLATE,
+    CONF_USE_TIMER_WHEEL,
+    DATA_CAROUSELS,
     DOMAIN,
-    DOMAIN_NAME,
     EVENT_STARTING_OVER,
     LOGGER,
     SERVICE_ADD_ENTITY_ID,
@@ -59,7 +76,12 @@ from .const import (
     TRANSLATION_KEY_MISSING__TIMER_ENTITY,
     TRANSLATION_KEY_MISSING_ENTITY,
     TRANSLATION_KEY_TEMPLATE_ERROR,
+    UPCOMING_SIZE,
 )
+from .entity_info_list import EntityInfoList
+from .issue_tracker import IssueTracker
+from .member_hub import MemberHub
+from .show_if_filter import ShowIfFilterError, ShowIfPredicate, compile_show_if_filter
 from .hass_util import TimerTrigger, TimerTriggerErrorEnum
 
 
@@ -69,6 +91,7 @@ class BaseCarouselEntity(Entity):
     """Base Carousel entity."""
 
     restart_timer: bool = True
+    entity_info_class: type[BaseEntityInfo] = BaseEntityInfo
     _unrecorded_attributes = frozenset({MATCH_ALL})
 
     # ------------------------------------------------------
@@ -81,8 +104,39 @@ class BaseCarouselEntity(Entity):
         self.hass: HomeAssistant = hass
         self.entry: ConfigEntry = entry
 
-        self.entities_list: list[BaseEntityInfo]
-        self.cancel_state_listener: CALLBACK_TYPE = None
+        self.entities_list: EntityInfoList[BaseEntityInfo]
+        self.member_hub: MemberHub = MemberHub.async_get(self.hass)
+        self.member_job: HassJob = HassJob(self.member_state_listener)
+        self.tracked_entity_ids: set[str] = set()
+        self.visible_entity_ids: set[str] = set()
+        self.missing_entities: dict[str, BaseEntityInfo] = {}
+        self.expiry_heap: list[tuple[datetime, str]] = []
+
+        self.configured_entity_ids: set[str] = set(
+            self.entry.options.get(CONF_ENTITY_IDS, [])
+        )
+
+        self.min_write_interval: float = 0
+        self.last_state_write: float = 0
+        self.cancel_trailing_write: CALLBACK_TYPE | None = None
+        self.last_fingerprint: tuple | None = None
+
+        self.attributes_include: list[str] = []
+        self.attributes_exclude: frozenset[str] = frozenset()
+        self.projected_attributes_key: tuple | None = None
+        self.projected_attributes_state: State | None = None
+        self.projected_attributes: dict = {}
+        self.state_writes: int = 0
+        self.suppressed_writes: int = 0
+
+        self.upcoming: deque[str] = deque()
+        self.upcoming_refill_scheduled: bool = False
+        self.prune_handle: asyncio.Handle | None = None
+
+        self.pending_moves: list[Callable[[], None]] = []
+        self.pending_refresh: asyncio.Future | None = None
+        self.refresh_task: asyncio.Task | None = None
+        self.cancel_expiry_timer: CALLBACK_TYPE | None = None
 
         self.current_entity: BaseEntityInfo = None
         self.current_entity_pos = -1
@@ -91,8 +145,16 @@ class BaseCarouselEntity(Entity):
 
         self.timer_trigger: TimerTrigger
 
-        self.last_error_template: str = ""
-        self.last_error_txt_template: str = ""
+        self.issues: IssueTracker = IssueTracker(self.hass, self.entry.entry_id)
+
+        self.storage: CarouselStorage = CarouselStorage(self.hass, self.entry.entry_id)
+        self.template_error_entity_ids: set[str] = set()
+
+        self.show_if_filter: ShowIfPredicate | None = None
+        self.show_if_template: Template | None = None
+        self.template_trackers: dict[str, TrackTemplateResultInfo] = {}
+
+        self.load_options()
 
         self.coordinator: DataUpdateCoordinator = DataUpdateCoordinator(
             self.hass,
@@ -113,6 +175,8 @@ class BaseCarouselEntity(Entity):
             ),
             callback_trigger=self.async_handle_timer_finished,
             auto_restart=self.entry.options.get(CONF_RESTART_TIMER, False),
+            use_timer_wheel=self.entry.options.get(CONF_USE_TIMER_WHEEL, False),
+            align_to_clock=self.entry.options.get(CONF_ALIGN_TO_CLOCK, False),
         )
 
         self.device_info = DeviceInfo(
@@ -123,6 +187,112 @@ class BaseCarouselEntity(Entity):
             name=self.entry.title,
         )
 
+    # ------------------------------------------------------------------
+    def load_options(self) -> None:
+        """Load the options, which can be changed on the running carousel."""
+
+        self.min_write_interval = self.entry.options.get(CONF_MIN_WRITE_INTERVAL, 0)
+
+        self.attributes_include = self.entry.options.get(CONF_ATTRIBUTES_INCLUDE, [])
+        self.attributes_exclude = frozenset(
+            self.entry.options.get(CONF_ATTRIBUTES_EXCLUDE, [])
+        )
+        self.projected_attributes_key = None
+
+        self.show_if_filter = None
+
+        if self.entry.options.get(CONF_SHOW_IF_FILTER):
+            try:
+                self.show_if_filter = compile_show_if_filter(
+                    self.entry.options[CONF_SHOW_IF_FILTER]
+                )
+            except ShowIfFilterError as err:
+                LOGGER.error("Invalid show if filter in %s: %s", self.entry.title, err)
+
+        template: str = str(self.entry.options.get(CONF_SHOW_IF_TEMPLATE) or "")
+
+        if template == "":
+            self.show_if_template = None
+        elif (
+            self.show_if_template is None or self.show_if_template.template != template
+        ):
+            self.show_if_template = Template(template, self.hass)
+
+    # ------------------------------------------------------------------
+    async def async_apply_options(self) -> None:
+        """Apply changed options to the running carousel, keeping its position."""
+
+        show_if_template: Template | None = self.show_if_template
+        self.load_options()
+
+        # The options change the written attributes, so write the state even
+        # if nothing else changed.
+        self.last_fingerprint = None
+        self.projected_attributes_state = None
+
+        if self.show_if_template is not show_if_template:
+            self.template_error_entity_ids.clear()
+            self.delete_issue(TRANSLATION_KEY_TEMPLATE_ERROR)
+
+            for entity_id in list(self.template_trackers):
+                self.untrack_template(entity_id)
+
+            for entity_info in self.entities_list:
+                entity_info.template_last_updated = None
+
+        if not self.has_show_if:
+            self.visible_entity_ids.clear()
+
+            for entity_info in self.entities_list:
+                entity_info.is_visible = True
+
+        self.apply_entity_ids()
+        self.update_all_visibility()
+
+        await self.timer_trigger.async_set_options(
+            timer_entity=self.entry.options.get(CONF_LISTEN_TO_TIMER_TRIGGER, ""),
+            duration=timedelta(
+                minutes=self.entry.options.get(CONF_ROTATE_EVERY_MINUTES, 1)
+            ),
+            auto_restart=self.entry.options.get(CONF_RESTART_TIMER, False),
+            use_timer_wheel=self.entry.options.get(CONF_USE_TIMER_WHEEL, False),
+            align_to_clock=self.entry.options.get(CONF_ALIGN_TO_CLOCK, False),
+        )
+
+        self.upcoming.clear()
+        await self.async_request_refresh(self.move_stay)
+
+    # ------------------------------------------------------------------
+    def apply_entity_ids(self) -> None:
+        """Add and remove the entities changed in the options.
+
+        Entities added or removed by the services are left as they are.
+        """
+
+        entity_ids: list[str] = er.async_validate_entity_ids(
+            er.async_get(self.hass), self.entry.options.get(CONF_ENTITY_IDS, [])
+        )
+
+        for entity_id in self.configured_entity_ids.difference(entity_ids):
+            self.remove_entity_info(entity_id)
+
+        for entity_id in entity_ids:
+            if (
+                entity_id in self.configured_entity_ids
+                or entity_id in self.entities_list
+                or entity_id in self.missing_entities
+            ):
+                continue
+
+            self.entities_list.append(self.entity_info_class(entity_id))
+            self.track_member(entity_id)
+
+        if self.configured_entity_ids != set(entity_ids):
+            self.configured_entity_ids = set(entity_ids)
+            self.schedule_save()
+
+        self.prune_missing_entities()
+
     # ------------------------------------------------------------------
     def register_entity_services(self) -> None:
         """Register entity services."""
@@ -164,11 +334,26 @@ class BaseCarouselEntity(Entity):
         self, entity: BaseCarouselEntity, service_data: ServiceCall
     ) -> None:
         """Add entity."""
-        entity.entities_list.append(
-            BaseEntityInfo(service_data.data.get(SERVICE_ADD_ENTITY_ID), "")
+        entity_info: BaseEntityInfo = entity.entity_info_class(
+            service_data.data.get(SERVICE_ADD_ENTITY_ID),
+            show_x_times=service_data.data.get(SERVICE_SHOW_X_TIMES),
+            remove_at_timedelta=service_data.data.get(SERVICE_SHOW_FOR),
         )
+
+        if not entity.entities_list.append(entity_info):
+            return
+
+        entity.schedule_expiry(entity_info)
+
         await entity.async_verify_entities_exist()
 
+        if entity_info.entity_id in entity.entities_list:
+            entity.update_entity_visibility(entity_info)
+            entity.track_member(entity_info.entity_id)
+            entity.schedule_upcoming_refill()
+
+        entity.schedule_save()
+
     # ------------------------------------------------------------------
     async def async_show_entity(
         self, entity: BaseCarouselEntity, service_data: ServiceCall
@@ -176,13 +361,15 @@ class BaseCarouselEntity(Entity):
         """Show entity."""
 
         if (
-            pos := entity.find_entity_pos(
-                service_data.data.get(SERVICE_SHOW_ENTITY_ID, "")
+            entity.find_entity_pos(service_data.data.get(SERVICE_SHOW_ENTITY_ID, ""))
+            > -1
+        ):
+            await entity.async_request_refresh(
+                partial(
+                    entity.move_to_entity,
+                    service_data.data.get(SERVICE_SHOW_ENTITY_ID, ""),
+                )
             )
-        ) > -1:
-            entity.current_entity_pos = pos
-            entity.stay_at_current_pos = True
-            await entity.coordinator.async_refresh()
 
     # ------------------------------------------------------------------
     async def async_show_next(
@@ -190,7 +377,7 @@ class BaseCarouselEntity(Entity):
     ) -> None:
         """Show next."""
 
-        await entity.coordinator.async_refresh()
+        await entity.async_request_refresh()
 
     # ------------------------------------------------------------------
     async def async_show_prev(
@@ -198,10 +385,10 @@ class BaseCarouselEntity(Entity):
     ) -> None:
         """Show prev."""
 
-        if not entity.prev_entity_pos():
+        if len(entity.entities_list) == 0:
             return
 
-        await entity.coordinator.async_refresh()
+        await entity.async_request_refresh(entity.prev_entity_pos)
 
     # ------------------------------------------------------------------
     async def async_remove_entity(
@@ -210,13 +397,15 @@ class BaseCarouselEntity(Entity):
         """Remove entity."""
 
         if (
-            pos := entity.find_entity_pos(
-                service_data.data.get(SERVICE_REMOVE_ENTITY_ID, "")
+            entity.find_entity_pos(service_data.data.get(SERVICE_REMOVE_ENTITY_ID, ""))
+            > -1
+        ):
+            await entity.async_request_refresh(
+                partial(
+                    entity.move_remove_entity,
+                    service_data.data.get(SERVICE_REMOVE_ENTITY_ID, ""),
+                )
             )
-        ) > -1:
-            del entity.entities_list[pos]
-            entity.stay_at_current_pos = True
-            await entity.coordinator.async_refresh()
 
     # ------------------------------------------------------------------
     async def async_handle_timer_finished(self, error: TimerTriggerErrorEnum) -> None:
@@ -238,16 +427,205 @@ class BaseCarouselEntity(Entity):
                     pass
             return
 
-        await self.coordinator.async_refresh()
+        self.delete_issue(TRANSLATION_KEY_MISSING__TIMER_ENTITY)
+        await self.async_request_refresh()
+
+    # ------------------------------------------------------------------
+    async def async_request_refresh(
+        self, move: Callable[[], None] | None = None
+    ) -> None:
+        """Request refresh.
+
+        Refreshes are run one at a time. Requests made while a refresh is
+        running are merged into one pending refresh, and position moves are
+        applied right before it starts, so they never interleave with a
+        running refresh.
+        """
+
+        if move is not None:
+            self.pending_moves.append(move)
+
+        if self.pending_refresh is None:
+            self.pending_refresh = self.hass.loop.create_future()
+
+            if self.refresh_task is None:
+                self.refresh_task = self.hass.async_create_task(
+                    self.async_run_refresh()
+                )
+
+        await asyncio.shield(self.pending_refresh)
+
+    # ------------------------------------------------------------------
+    async def async_run_refresh(self) -> None:
+        """Run pending refreshes one at a time.
+
+        An error in a move or the refresh is raised to the callers waiting for
+        that refresh, and the following refreshes are still run.
+        """
+
+        try:
+            while self.pending_refresh is not None:
+                pending_refresh: asyncio.Future = self.pending_refresh
+                self.pending_refresh = None
+
+                moves: list[Callable[[], None]] = self.pending_moves
+                self.pending_moves = []
+
+                try:
+                    for move in moves:
+                        move()
+
+                    await self.coordinator.async_refresh()
+
+                except Exception as err:  # noqa: BLE001
+                    pending_refresh.set_exception(err)
+
+                finally:
+                    if not pending_refresh.done():
+                        pending_refresh.set_result(None)
+        finally:
+            self.refresh_task = None
+
+            if self.pending_refresh is not None:
+                self.pending_refresh.cancel()
+                self.pending_refresh = None
+
+    # ------------------------------------------------------------------
+    def move_to_entity(self, entity_id: str) -> None:
+        """Move to entity."""
+
+        if (pos := self.find_entity_pos(entity_id)) > -1:
+            self.current_entity_pos = pos
+            self.stay_at_current_pos = True
+
+    # ------------------------------------------------------------------
+    def move_remove_entity(self, entity_id: str) -> None:
+        """Remove entity and stay at the current pos."""
+
+        if self.remove_entity_info(entity_id):
+            self.stay_at_current_pos = True
+            self.schedule_save()
+
+    # ------------------------------------------------------------------
+    def move_stay(self) -> None:
+        """Stay at the current pos."""
+
+        self.stay_at_current_pos = True
 
     # ------------------------------------------------------------------
     def find_entity_pos(self, entity_id: str) -> int:
         """Find entity pos."""
-        for index, entity in enumerate(self.entities_list):
-            if entity.entity_id == entity_id:
-                return index
+        return self.entities_list.find_pos(entity_id)
+
+    # ------------------------------------------------------------------
+    def remove_entity_info(self, entity_id: str) -> bool:
+        """Remove entity info and keep current entity pos in place."""
 
-        return -1
+        if self.missing_entities.pop(entity_id, None) is not None:
+            self.untrack_member(entity_id)
+            self.update_missing_entities_issue()
+            return True
+
+        if self.entities_list.remove(entity_id) is None:
+            return False
+
+        self.visible_entity_ids.discard(entity_id)
+        self.clear_template_error(entity_id)
+        self.compact_entities_list()
+        self.untrack_member(entity_id)
+        self.untrack_template(entity_id)
+
+        if entity_id in self.upcoming:
+            self.schedule_upcoming_refill()
+
+        return True
+
+    # ------------------------------------------------------------------
+    def prune_missing_entities(self) -> bool:
+        """Move all entities without a state to the missing entities.
+
+        The missing entities are still tracked, so they are added again when
+        their state reappears. One issue is created for all of them.
+        """
+
+        missing: list[BaseEntityInfo] = [
+            entity_info
+            for entity_info in self.entities_list
+            if self.hass.states.get(entity_info.entity_id) is None
+        ]
+
+        if len(missing) == 0:
+            return False
+
+        for entity_info in missing:
+            self.entities_list.remove(entity_info.entity_id)
+            self.visible_entity_ids.discard(entity_info.entity_id)
+            self.missing_entities[entity_info.entity_id] = entity_info
+            self.track_member(entity_info.entity_id)
+            self.untrack_template(entity_info.entity_id)
+
+        self.compact_entities_list()
+        self.upcoming.clear()
+        self.update_missing_entities_issue()
+
+        return True
+
+    # ------------------------------------------------------------------
+    def update_missing_entities_issue(self) -> None:
+        """Create, update or delete the issue for the missing entities."""
+
+        if len(self.missing_entities) == 0:
+            self.delete_issue(TRANSLATION_KEY_MISSING_ENTITY)
+            return
+
+        self.create_issue(
+            TRANSLATION_KEY_MISSING_ENTITY,
+            {
+                "entity": ", ".join(self.missing_entities),
+                "carousel_helper": self.entity_id,
+            },
+        )
+
+    # ------------------------------------------------------------------
+    async def async_readmit_entity(self, entity_id: str) -> None:
+        """Add missing entity again, now its state is back."""
+
+        entity_info: BaseEntityInfo = self.missing_entities.pop(entity_id)
+        self.update_missing_entities_issue()
+
+        if (
+            entity_info.remove_at is not None
+            and entity_info.remove_at <= dt_util.utcnow()
+        ):
+            self.untrack_member(entity_id)
+            return
+
+        self.entities_list.append(entity_info)
+        self.schedule_expiry(entity_info)
+        self.update_entity_visibility(entity_info)
+        self.schedule_upcoming_refill()
+
+        if self.current_entity is None:
+            await self.async_request_refresh()
+
+    # ------------------------------------------------------------------
+    def compact_entities_list(self) -> None:
+        """Compact entities list.
+
+        Postponed while the current entity slot is empty, so the next entity
+        is still the one following the removed current entity.
+        """
+
+        if not self.entities_list.needs_compaction:
+            return
+
+        if (
+            0 <= self.current_entity_pos < self.entities_list.slot_count
+            and self.entities_list[self.current_entity_pos] is None
+        ):
+            return
+
+        self.current_entity_pos = self.entities_list.compact(self.current_entity_pos)
 
     # ------------------------------------------------------------------
     def remove_expired_entities(self) -> None:
@@ -258,17 +636,65 @@ class BaseCarouselEntity(Entity):
             and self.current_entity.show_x_times is not None
         ):
             if self.current_entity.show_x_times <= 0:
-                del self.entities_list[self.current_entity_pos]
+                self.remove_entity_info(self.current_entity.entity_id)
             else:
                 self.current_entity.show_x_times -= 1
-                self.entities_list[self.current_entity_pos] = self.current_entity
 
-        if (
-            self.current_entity is not None
-            and self.current_entity.remove_at is not None
-            and self.current_entity.remove_at < datetime.now()
-        ):
-            del self.entities_list[self.current_entity_pos]
+            self.schedule_save()
+
+    # ------------------------------------------------------------------
+    def schedule_expiry(self, entity_info: BaseEntityInfo) -> None:
+        """Schedule removal of entity at its remove at time."""
+
+        if entity_info.remove_at is None:
+            return
+
+        heapq.heappush(self.expiry_heap, (entity_info.remove_at, entity_info.entity_id))
+
+        if self.expiry_heap[0][1] == entity_info.entity_id:
+            self.arm_expiry_timer()
+
+    # ------------------------------------------------------------------
+    def arm_expiry_timer(self) -> None:
+        """Arm the expiry timer for the earliest remove at time."""
+
+        if self.cancel_expiry_timer is not None:
+            self.cancel_expiry_timer()
+            self.cancel_expiry_timer = None
+
+        if len(self.expiry_heap) > 0:
+            self.cancel_expiry_timer = async_track_point_in_utc_time(
+                self.hass, self.async_expiry_timer, self.expiry_heap[0][0]
+            )
+
+    # ------------------------------------------------------------------
+    async def async_expiry_timer(self, now: datetime) -> None:
+        """Remove entities which have expired."""
+
+        self.cancel_expiry_timer = None
+        current_removed: bool = False
+        removed: bool = False
+
+        while len(self.expiry_heap) > 0 and self.expiry_heap[0][0] <= now:
+            remove_at, entity_id = heapq.heappop(self.expiry_heap)
+
+            if (
+                entity_info := self.entities_list.get(entity_id)
+            ) is None or entity_info.remove_at != remove_at:
+                continue
+
+            current_removed |= entity_info is self.current_entity
+            removed |= self.remove_entity_info(entity_id)
+
+        self.arm_expiry_timer()
+
+        if current_removed:
+            await self.async_request_refresh()
+        elif removed:
+            self.async_write_state()
+
+        if removed:
+            self.schedule_save()
 
     # ------------------------------------------------------------------
     def next_entity_pos(self) -> bool:
@@ -278,15 +704,19 @@ class BaseCarouselEntity(Entity):
             self.current_entity = None
             return False
 
-        if self.stay_at_current_pos:
-            self.stay_at_current_pos = False
-        else:
-            self.current_entity_pos += 1
+        tmp_pos: int = self.entities_list.next_pos(
+            self.current_entity_pos, include_pos=self.stay_at_current_pos
+        )
 
-        if (self.current_entity_pos + 1) > len(self.entities_list):
-            self.current_entity_pos = 0
+        if tmp_pos <= self.current_entity_pos and not (
+            self.stay_at_current_pos and tmp_pos == self.current_entity_pos
+        ):
             self.first_entity = True
 
+        self.stay_at_current_pos = False
+        self.current_entity_pos = tmp_pos
+        self.compact_entities_list()
+
         return True
 
     # ------------------------------------------------------------------
@@ -297,10 +727,8 @@ class BaseCarouselEntity(Entity):
             self.current_entity = None
             return False
 
-        if self.current_entity_pos <= 1:
-            self.current_entity_pos = len(self.entities_list) - 1
-        else:
-            self.current_entity_pos -= 2
+        self.current_entity_pos = self.entities_list.prev_pos(self.current_entity_pos)
+        self.stay_at_current_pos = True
 
         return True
 
@@ -308,74 +736,440 @@ class BaseCarouselEntity(Entity):
     async def async_get_next_entity(self) -> None:
         """Get next entity."""
 
-        if self.cancel_state_listener is not None:
-            self.cancel_state_listener()
-            self.cancel_state_listener = None
+        while self.next_entity_pos():
+            self.current_entity = self.entities_list[self.current_entity_pos]
 
-        if not self.next_entity_pos():
+            if self.hass.states.get(self.current_entity.entity_id) is not None:
+                self.current_entity.member = self.member_hub.get_member(
+                    self.current_entity.entity_id
+                )
+                return
+
+            self.prune_missing_entities()
+
+    # ------------------------------------------------------------------
+    def take_upcoming(self) -> bool:
+        """Move to the first upcoming entity.
+
+        Returns False if there is no usable upcoming entity, then the next entity
+        must be found the slow way.
+        """
+
+        if self.stay_at_current_pos or len(self.upcoming) == 0:
+            return False
+
+        entity_id: str = self.upcoming.popleft()
+        entity_info: BaseEntityInfo | None = self.entities_list.get(entity_id)
+
+        if entity_info is not None and self.hass.states.get(entity_id) is None:
+            self.schedule_prune_missing()
+
+        if (
+            entity_info is None
+            or not entity_info.is_visible
+            or self.hass.states.get(entity_id) is None
+        ):
+            self.upcoming.clear()
+            return False
+
+        pos: int = self.entities_list.find_pos(entity_id)
+
+        if pos <= self.current_entity_pos:
+            self.first_entity = True
+
+        self.current_entity_pos = pos
+        self.compact_entities_list()
+
+        self.current_entity = entity_info
+        self.current_entity.member = self.member_hub.get_member(entity_id)
+        return True
+
+    # ------------------------------------------------------------------
+    @callback
+    def schedule_upcoming_refill(self) -> None:
+        """Refill upcoming entities soon, outside the current refresh."""
+
+        if self.upcoming_refill_scheduled:
             return
 
-        self.current_entity = self.entities_list[self.current_entity_pos]
-        self.current_entity.state = self.hass.states.get(self.current_entity.entity_id)
+        self.upcoming_refill_scheduled = True
+        self.hass.loop.call_soon(self.refill_upcoming)
 
-        if self.current_entity.state is not None:
-            self.current_entity.entity_obj = self.platform.domain_entities.get(
-                self.current_entity.entity_id, None
-            )
-        else:
-            self.create_issue(
-                TRANSLATION_KEY_MISSING_ENTITY,
-                {
-                    "entity": self.current_entity.entity_id,
-                    "carousel_helper": self.entity_id,
-                },
-            )
-            self.entities_list.pop(self.current_entity_pos)
-            await self.async_get_next_entity()
+    # ------------------------------------------------------------------
+    @callback
+    def refill_upcoming(self) -> None:
+        """Refill upcoming with the next visible entities after the current."""
+
+        self.upcoming_refill_scheduled = False
+        self.upcoming.clear()
+
+        if self.current_entity is None:
+            return
+
+        tmp_pos: int = self.current_entity_pos
+
+        for _ in range(self.entities_list.slot_count):
+            tmp_pos = self.entities_list.next_pos(tmp_pos)
+
+            # One more than shown, so a full window is left after taking one
+            if tmp_pos == -1 or len(self.upcoming) > UPCOMING_SIZE:
+                break
+
+            entity_info: BaseEntityInfo | None = self.entities_list[tmp_pos]
+
+            if entity_info is None:
+                continue
+
+            if self.hass.states.get(entity_info.entity_id) is None:
+                self.schedule_prune_missing()
+
+            elif entity_info.is_visible:
+                self.upcoming.append(entity_info.entity_id)
+
+    # ------------------------------------------------------------------
+    @callback
+    def schedule_prune_missing(self) -> None:
+        """Prune entities without a state soon, so a burst of removals is one pass."""
+
+        if self.prune_handle is None:
+            self.prune_handle = self.hass.loop.call_soon(self.async_prune_missing)
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_prune_missing(self) -> None:
+        """Prune entities without a state, and move on if the current is pruned."""
+
+        self.prune_handle = None
+
+        if not self.prune_missing_entities():
             return
 
+        if (
+            self.current_entity is not None
+            and self.current_entity.entity_id in self.missing_entities
+        ):
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        self.refill_upcoming()
+        self.async_write_state()
+
     # ------------------------------------------------------------------
     async def async_find_entity_template_ok(self) -> bool:
-        """Find entity template ok."""
+        """Find entity template ok.
+
+        Visibility is kept up to date by the member state listener, so no
+        template is rendered here.
+        """
+
+        if len(self.visible_entity_ids) == 0:
+            self.current_entity = None
+            return False
 
         tmp_pos: int = 1
-        tmp_res: str = ""
-        str_true: str = str(True)
 
-        while tmp_res != str_true and tmp_pos <= len(self.entities_list):
-            try:
-                tmp_state: State = self.hass.states.get(self.current_entity.entity_id)
-
-                if tmp_state is not None:
-                    template_values: dict = {
-                        "state": tmp_state.state,
-                        "state_attributes": tmp_state.attributes.copy(),
-                    }
-                    value_template: Template | None = Template(
-                        str(self.entry.options.get(CONF_SHOW_IF_TEMPLATE)), self.hass
-                    )
+        while self.current_entity is not None and not self.current_entity.is_visible:
+            if tmp_pos >= len(self.entities_list):
+                self.current_entity = None
+                break
+
+            await self.async_get_next_entity()
+            tmp_pos += 1
 
-                    tmp_res = str(value_template.async_render(template_values))
+        return self.current_entity is not None
 
-            except (TypeError, TemplateError) as e:
-                self.create_issue_template(str(e))
-                return False
+    # ------------------------------------------------------------------
+    def update_entity_visibility(self, entity_info: BaseEntityInfo | None) -> None:
+        """Update visibility of entity from the show if filter and template."""
 
-            if tmp_res == str_true:
-                self.entities_list[self.current_entity_pos].is_visible = True
+        if entity_info is None or not self.has_show_if:
+            return
 
-            else:
-                self.entities_list[self.current_entity_pos].is_visible = False
-                await self.async_get_next_entity()
+        was_visible: bool = entity_info.entity_id in self.visible_entity_ids
 
-            tmp_pos += 1
+        try:
+            entity_info.is_visible = self.show_if(entity_info)
 
-        if tmp_res != str_true:
-            self.current_entity = None
+        except (TypeError, TemplateError) as e:
+            self.template_error_entity_ids.add(entity_info.entity_id)
+            self.create_issue_template(str(e))
+            entity_info.is_visible = False
+
+        else:
+            self.clear_template_error(entity_info.entity_id)
+
+        if entity_info.is_visible:
+            self.visible_entity_ids.add(entity_info.entity_id)
+        else:
+            self.visible_entity_ids.discard(entity_info.entity_id)
+
+        if entity_info.is_visible != was_visible:
+            self.schedule_upcoming_refill()
+
+    # ------------------------------------------------------------------
+    def update_all_visibility(self) -> None:
+        """Update visibility of all entities."""
+
+        for entity_info in self.entities_list:
+            self.update_entity_visibility(entity_info)
+
+    # ------------------------------------------------------------------
+    def track_members(self) -> None:
+        """Track state changes of all entities through the member hub."""
+
+        for entity_info in self.entities_list:
+            self.track_member(entity_info.entity_id)
+
+    # ------------------------------------------------------------------
+    def track_member(self, entity_id: str) -> None:
+        """Track state changes of entity through the member hub."""
+
+        if entity_id in self.tracked_entity_ids:
+            return
+
+        self.tracked_entity_ids.add(entity_id)
+        self.member_hub.async_add_listener(entity_id, self.member_job)
+
+    # ------------------------------------------------------------------
+    def untrack_member(self, entity_id: str) -> None:
+        """Stop tracking state changes of entity."""
+
+        if entity_id not in self.tracked_entity_ids:
+            return
+
+        self.tracked_entity_ids.discard(entity_id)
+        self.member_hub.async_remove_listener(entity_id, self.member_job)
+
+    # ------------------------------------------------------
+    async def member_state_listener(
+        self,
+        event: Event[EventStateChangedData],
+    ) -> None:
+        """Handle state changes on the entities."""
+
+        entity_id: str = event.data[ATTR_ENTITY_ID]
+
+        if (entity_info := self.entities_list.get(entity_id)) is None:
+            if entity_id in self.missing_entities and event.data["new_state"]:
+                await self.async_readmit_entity(entity_id)
+            return
+
+        if event.data["new_state"] is None:
+            self.schedule_prune_missing()
+            return
+
+        self.update_entity_visibility(entity_info)
+
+        if entity_info is not self.current_entity:
+            return
+
+        if not entity_info.is_visible:
+            await self.async_request_refresh(self.move_stay)
+            return
+
+        await self.async_current_entity_changed()
+
+    # ------------------------------------------------------
+    async def async_current_entity_changed(self) -> None:
+        """Current entity state changed, write the new state.
+
+        No entity selection is done, and the entity info is only resolved again
+        if the member info has been invalidated.
+        """
+
+        if (
+            self.current_entity.member is not None
+            and not self.current_entity.member.info_valid
+        ):
+            await self.async_get_entity_info(self.current_entity)
+            self.device_class = self.current_entity.device_class
+
+        self.async_write_state_rate_limited()
+
+    # ------------------------------------------------------
+    @callback
+    def async_write_state_rate_limited(self) -> None:
+        """Write state, at most once per min write interval.
+
+        A write within the interval is postponed to the end of it, so the latest
+        state is always written.
+        """
+
+        elapsed: float = self.hass.loop.time() - self.last_state_write
+
+        if self.min_write_interval <= 0 or elapsed >= self.min_write_interval:
+            self.async_write_state()
+            return
+
+        if self.cancel_trailing_write is None:
+            self.cancel_trailing_write = async_call_later(
+                self.hass,
+                self.min_write_interval - elapsed,
+                self.async_trailing_write,
+            )
+
+    # ------------------------------------------------------
+    @callback
+    def async_trailing_write(self, _now: datetime) -> None:
+        """Write postponed state."""
+
+        self.cancel_trailing_write = None
+        self.async_write_state()
+
+    # ------------------------------------------------------
+    @callback
+    def async_write_state(self) -> None:
+        """Write state, if it differs from the last written state."""
+
+        if self.cancel_trailing_write is not None:
+            self.cancel_trailing_write()
+            self.cancel_trailing_write = None
+
+        fingerprint: tuple = self.state_fingerprint()
+
+        if fingerprint == self.last_fingerprint:
+            self.suppressed_writes += 1
+            return
+
+        self.last_fingerprint = fingerprint
+        self.last_state_write = self.hass.loop.time()
+        self.state_writes += 1
+        self.async_write_ha_state()
+
+    # ------------------------------------------------------
+    def state_fingerprint(self) -> tuple:
+        """Fingerprint of everything the written state is derived from."""
+
+        if self.current_entity is None:
+            return (self.available, self.entry.title, self.visible_count)
+
+        return (
+            self.available,
+            self.current_entity.entity_id,
+            self.current_entity.state,
+            self.current_entity.friendly_name,
+            self.current_entity.icon,
+            self.current_entity.unit_of_measurement,
+            self.current_entity.device_class,
+            self.visible_count,
+            self.upcoming_entity_ids,
+        )
+
+    # ------------------------------------------------------------------
+    @property
+    def has_show_if(self) -> bool:
+        """Show if filter or template is used."""
+        return self.show_if_filter is not None or self.show_if_template is not None
+
+    # ------------------------------------------------------------------
+    def show_if(self, entity_info: BaseEntityInfo) -> bool:
+        """Entity passes the show if filter and template.
+
+        The filter is checked first, so the template is only rendered for
+        entities passing the filter.
+        """
+
+        state: State | None = self.hass.states.get(entity_info.entity_id)
+
+        if state is None:
+            return False
+
+        if self.show_if_filter is not None and not self.show_if_filter(state):
             return False
 
+        if self.show_if_template is not None:
+            return self.render_show_if_template(entity_info, state)
+
         return True
 
+    # ------------------------------------------------------------------
+    def render_show_if_template(
+        self, entity_info: BaseEntityInfo, state: State
+    ) -> bool:
+        """Render show if template for entity.
+
+        The result is cached on the entity info until the state of the entity
+        is updated. If the template reads other entities or the time, the entity
+        is tracked with a template tracker, which updates the cached result.
+        """
+
+        if entity_info.template_last_updated == state.last_updated:
+            return entity_info.template_result
+
+        variables: dict = {
+            "state": state.state,
+            "state_attributes": state.attributes,
+        }
+        render_info: RenderInfo = self.show_if_template.async_render_to_info(
+            variables, parse_result=False
+        )
+
+        if (
+            render_info.all_states
+            or render_info.all_states_lifecycle
+            or render_info.domains
+            or render_info.domains_lifecycle
+            or render_info.has_time
+            or len(render_info.entities - {entity_info.entity_id}) > 0
+        ):
+            self.track_template(entity_info.entity_id, variables)
+        else:
+            self.untrack_template(entity_info.entity_id)
+
+        entity_info.template_result = str(render_info.result()) == str(True)
+        entity_info.template_last_updated = state.last_updated
+
+        return entity_info.template_result
+
+    # ------------------------------------------------------------------
+    def track_template(self, entity_id: str, variables: dict) -> None:
+        """Track the show if template of entity, with the variables of its state.
+
+        The tracker is replaced when the state of the entity is updated.
+        """
+
+        self.untrack_template(entity_id)
+        self.template_trackers[entity_id] = async_track_template_result(
+            self.hass,
+            [TrackTemplate(self.show_if_template, variables)],
+            partial(self.async_template_result, entity_id),
+        )
+
+    # ------------------------------------------------------------------
+    def untrack_template(self, entity_id: str) -> None:
+        """Stop tracking the show if template of entity."""
+
+        if (tracker := self.template_trackers.pop(entity_id, None)) is not None:
+            tracker.async_remove()
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_template_result(
+        self,
+        entity_id: str,
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        """Show if template of entity changed result, update its visibility."""
+
+        if (entity_info := self.entities_list.get(entity_id)) is None:
+            return
+
+        result: Any = updates[-1].result
+
+        if isinstance(result, TemplateError):
+            # Rendered again by update_entity_visibility, to report the error.
+            entity_info.template_last_updated = None
+        else:
+            entity_info.template_result = str(result) == str(True)
+
+        self.update_entity_visibility(entity_info)
+
+        if entity_info is self.current_entity and not entity_info.is_visible:
+            self.hass.async_create_task(self.async_request_refresh(self.move_stay))
+        else:
+            self.async_write_state()
+
     # ------------------------------------------------------------------
     async def async_refresh(self) -> None:
         """Refresh."""
@@ -387,13 +1181,21 @@ class BaseCarouselEntity(Entity):
 
         self.remove_expired_entities()
 
-        await self.async_get_next_entity()
+        if self.take_upcoming():
+            self.schedule_upcoming_refill()
+        else:
+            await self.async_get_next_entity()
 
-        if len(self.entities_list) > 0 and self.entry.options.get(
-            CONF_SHOW_IF_TEMPLATE, ""
-        ):
-            if not await self.async_find_entity_template_ok():
-                return
+            if len(self.entities_list) > 0 and self.has_show_if:
+                if not await self.async_find_entity_template_ok():
+                    self.upcoming.clear()
+                    return
+
+            self.refill_upcoming()
+
+        if self.current_entity is None:
+            # All members are missing, e.g. their integration is not loaded.
+            return
 
         if self.first_entity:
             self.hass.bus.async_fire(
@@ -402,31 +1204,10 @@ class BaseCarouselEntity(Entity):
 
         self.first_entity = False
 
-        self.current_entity = self.entities_list[
-            self.current_entity_pos
-        ] = await self.async_get_entity_info(self.current_entity)
+        self.current_entity = await self.async_get_entity_info(self.current_entity)
 
         self.device_class = self.current_entity.device_class
 
-        if self.current_entity is not None:
-            self.cancel_state_listener = async_track_state_change_event(
-                self.hass,
-                self.current_entity.entity_id,
-                self.sensor_state_listener,
-            )
-
-    # ------------------------------------------------------
-    @callback
-    async def sensor_state_listener(
-        self,
-        event: Event[EventStateChangedData],
-    ) -> None:
-        """Handle state changes on the observed device."""
-
-        if event.data[ATTR_ENTITY_ID] == self.current_entity.entity_id:
-            self.stay_at_current_pos = True
-            await self.coordinator.async_refresh()
-
     # ------------------------------------------------------------------
     def create_issue(
         self,
@@ -435,16 +1216,13 @@ class BaseCarouselEntity(Entity):
     ) -> None:
         """Create issue on."""
 
-        ir.async_create_issue(
-            self.hass,
-            DOMAIN,
-            DOMAIN_NAME + datetime.now().isoformat(),
-            issue_domain=DOMAIN,
-            is_fixable=False,
-            severity=ir.IssueSeverity.WARNING,
-            translation_key=translation_key,
-            translation_placeholders=translation_placeholders,
-        )
+        self.issues.async_create(translation_key, translation_placeholders)
+
+    # ------------------------------------------------------------------
+    def delete_issue(self, translation_key: str) -> None:
+        """Delete issue, the condition has cleared."""
+
+        self.issues.async_delete(translation_key)
 
     # ------------------------------------------------------------------
     def create_issue_template(
@@ -453,136 +1231,192 @@ class BaseCarouselEntity(Entity):
     ) -> None:
         """Create issue on template."""
 
-        if (
-            self.last_error_template
-            != self.entry.options.get(CONF_SHOW_IF_TEMPLATE, "")
-            or error_txt != self.last_error_txt_template
-        ):
-            self.create_issue(
-                TRANSLATION_KEY_TEMPLATE_ERROR,
-                {
-                    "error_txt": error_txt,
-                    "template": self.entry.options.get(CONF_SHOW_IF_TEMPLATE, ""),
-                    "carousel_helper": self.entity_id,
-                },
-            )
+        self.create_issue(
+            TRANSLATION_KEY_TEMPLATE_ERROR,
+            {
+                "error_txt": error_txt,
+                "template": self.entry.options.get(CONF_SHOW_IF_TEMPLATE, ""),
+                "carousel_helper": self.entity_id,
+            },
+        )
 
-            self.last_error_template = self.entry.options.get(CONF_SHOW_IF_TEMPLATE, "")
-            self.last_error_txt_template = error_txt
+    # ------------------------------------------------------------------
+    def clear_template_error(self, entity_id: str) -> None:
+        """Clear template error of entity, delete the issue if none are left."""
+
+        if entity_id not in self.template_error_entity_ids:
+            return
+
+        self.template_error_entity_ids.discard(entity_id)
+
+        if len(self.template_error_entity_ids) == 0:
+            self.delete_issue(TRANSLATION_KEY_TEMPLATE_ERROR)
 
     # ------------------------------------------------------
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
 
-        if self.cancel_state_listener is not None:
-            self.cancel_state_listener()
+        self.hass.data.get(DATA_CAROUSELS, {}).pop(self.entry.entry_id, None)
+        self.issues.async_delete_all()
+
+        await self.async_save_storage()
+
+        for entity_id in list(self.tracked_entity_ids):
+            self.untrack_member(entity_id)
+
+        for entity_id in list(self.template_trackers):
+            self.untrack_template(entity_id)
+
+        if self.cancel_expiry_timer is not None:
+            self.cancel_expiry_timer()
+            self.cancel_expiry_timer = None
+
+        if self.cancel_trailing_write is not None:
+            self.cancel_trailing_write()
+            self.cancel_trailing_write = None
+
+        if self.prune_handle is not None:
+            self.prune_handle.cancel()
+            self.prune_handle = None
 
     # ------------------------------------------------------
     async def async_update(self) -> None:
         """Update the entity. Only used by the generic entity update service."""
-        await self.coordinator.async_request_refresh()
+        await self.async_request_refresh()
 
     # ------------------------------------------------------
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
 
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self.async_write_state)
         )
 
+        self.hass.data.setdefault(DATA_CAROUSELS, {})[self.entry.entry_id] = self
+
+        await self.async_restore_storage()
+
         self.async_on_remove(start.async_at_started(self.hass, self.async_hass_started))
+        self.async_on_remove(
+            self.hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, self.async_hass_stop)
+        )
 
     # ------------------------------------------------------
-    async def async_hass_started(self, _event: Event) -> None:
-        """Hass started."""
+    @callback
+    def async_hass_stop(self, event: Event) -> None:
+        """Save the position with the final write when Home Assistant stops.
 
-        await self.async_verify_entities_exist()
+        The position is not saved on every rotation, only when Home Assistant
+        stops or the carousel is removed.
+        """
+        self.schedule_save()
 
-        self.async_schedule_update_ha_state()
-        await self.coordinator.async_refresh()
+    # ------------------------------------------------------
+    @callback
+    def schedule_save(self) -> None:
+        """Save storage after the save delay, so a burst of changes is one write.
+
+        A pending save is also written when Home Assistant stops.
+        """
+        self.storage.async_schedule_save(update=self.update_storage)
 
     # ------------------------------------------------------
-    async def async_verify_entities_exist(self) -> bool:
-        """Verify entities exist."""
-        res: bool = True
-
-        for index, entity_info in reversed(list(enumerate(self.entities_list))):
-            state: State | None = self.hass.states.get(entity_info.entity_id)
-
-            if state is None:
-                self.create_issue(
-                    entity_info.entity_id,
-                    TRANSLATION_KEY_MISSING_ENTITY,
-                    {
-                        "entity": entity_info.entity_id,
-                        "carousel_helper": self.entity_id,
-                    },
-                )
-                del self.entities_list[index]
-                res = False
+    async def async_save_storage(self) -> None:
+        """Save storage now, unless unchanged."""
 
-        return res
+        self.update_storage()
+        await self.storage.async_write_settings()
 
     # ------------------------------------------------------
-    async def async_get_icon(self, entity_id: str) -> str:
-        """Get icon."""
+    def update_storage(self) -> None:
+        """Update storage with dynamic membership and position.
 
-        state: State | None = self.hass.states.get(entity_id)
-        tmp_icon = state.attributes.get(ATTR_ICON, None)
+        Entities added by the services and entities with show x times or show
+        for are saved as added, configured entities removed by the services
+        are saved as removed.
+        """
 
-        if tmp_icon is not None:
-            return tmp_icon
+        self.storage.current_entity_id = (
+            self.current_entity.entity_id if self.current_entity is not None else ""
+        )
+        self.storage.added_entities = [
+            {
+                "entity_id": entity_info.entity_id,
+                "show_x_times": entity_info.show_x_times,
+                "remove_at": entity_info.remove_at.isoformat()
+                if entity_info.remove_at is not None
+                else None,
+            }
+            for entity_info in (*self.entities_list, *self.missing_entities.values())
+            if entity_info.entity_id not in self.configured_entity_ids
+            or entity_info.show_x_times is not None
+            or entity_info.remove_at is not None
+        ]
+        self.storage.removed_entity_ids = [
+            entity_id
+            for entity_id in self.configured_entity_ids
+            if entity_id not in self.entities_list
+            and entity_id not in self.missing_entities
+        ]
 
-        entity_registry = er.async_get(self.hass)
-        source_entity = entity_registry.async_get(entity_id)
+    # ------------------------------------------------------
+    async def async_restore_storage(self) -> None:
+        """Restore dynamic membership and position."""
 
-        if source_entity is not None:
-            if source_entity.icon is not None:
-                return source_entity.icon
+        await self.storage.async_read_settings()
+        now: datetime = dt_util.utcnow()
 
-            icons = await ic.async_get_icons(
-                self.hass,
-                "entity",
-                integrations=[source_entity.platform],
-            )
+        for entity_id in self.storage.removed_entity_ids:
+            self.remove_entity_info(entity_id)
+
+        for added_entity in self.storage.added_entities:
+            remove_at: datetime | None = None
+
+            if added_entity.get("remove_at"):
+                remove_at = dt_util.parse_datetime(added_entity["remove_at"])
+
+                if remove_at is None or remove_at <= now:
+                    continue
 
             if (
-                icons is not None
-                and source_entity.platform in icons
-                and source_entity.domain in icons[source_entity.platform]
-                and source_entity.translation_key
-                in icons[source_entity.platform][source_entity.domain]
-                and "default"
-                in icons[source_entity.platform][source_entity.domain][
-                    source_entity.translation_key
-                ]
-            ):
-                return icons[source_entity.platform][source_entity.domain][
-                    source_entity.translation_key
-                ]["default"]
+                entity_info := self.entities_list.get(added_entity["entity_id"])
+            ) is None:
+                entity_info = self.entity_info_class(added_entity["entity_id"])
+                self.entities_list.append(entity_info)
 
-        return None
+            entity_info.show_x_times = added_entity.get("show_x_times")
+            entity_info.remove_at = remove_at
+            self.schedule_expiry(entity_info)
+
+        if (pos := self.find_entity_pos(self.storage.current_entity_id)) > -1:
+            self.current_entity_pos = pos
+            self.stay_at_current_pos = True
+
+    # ------------------------------------------------------
+    async def async_hass_started(self, _event: Event) -> None:
+        """Hass started."""
+
+        await self.async_verify_entities_exist()
+
+        self.update_all_visibility()
+        self.track_members()
+
+        self.async_schedule_update_ha_state()
+        await self.async_request_refresh()
+
+    # ------------------------------------------------------
+    async def async_verify_entities_exist(self) -> bool:
+        """Verify entities exist."""
+        return not self.prune_missing_entities()
 
     # ------------------------------------------------------
     async def async_get_entity_info(
         self, entity_info: BaseEntityInfo
     ) -> BaseEntityInfo:
         """Get entity info."""
-        state: State | None = self.hass.states.get(entity_info.entity_id)
-
-        if state is not None:
-            entity_info.friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME, None)
-            entity_info.device_class = get_device_class(
-                self.hass, entity_info.entity_id
-            )
-            entity_info.unit_of_measurement = state.attributes.get(
-                ATTR_UNIT_OF_MEASUREMENT, None
-            )
-
-            if entity_info.device_class is not None:
-                return entity_info
-
-            entity_info.icon = await self.async_get_icon(entity_info.entity_id)
+        entity_info.member = await self.member_hub.async_get_member_info(
+            entity_info.entity_id
+        )
 
         return entity_info
 
@@ -636,13 +1470,71 @@ class BaseCarouselEntity(Entity):
 
         """
 
-        attr: dict = {}
+        state: State | None = (
+            self.current_entity.state if self.current_entity is not None else None
+        )
+        key: tuple = (self.visible_count, self.upcoming_entity_ids)
 
-        if self.current_entity is not None and self.current_entity.state is not None:
-            attr = self.current_entity.state.attributes.copy()
+        # States are replaced on every change, so identity is enough
+        if (
+            state is not self.projected_attributes_state
+            or key != self.projected_attributes_key
+        ):
+            self.projected_attributes = self.project_attributes(state)
+            self.projected_attributes["carousel entities visible"] = self.visible_count
+            self.projected_attributes["upcoming"] = list(self.upcoming_entity_ids)
+            self.projected_attributes_key = key
+            self.projected_attributes_state = state
 
-        attr["carousel entities visible"] = len(
-            [p for p in self.entities_list if p.is_visible]
-        )
+        return self.projected_attributes
 
-        return attr
+    # ------------------------------------------------------
+    def project_attributes(self, state: State | None) -> dict:
+        """Attributes of the member state mirrored by the carousel."""
+
+        if state is None:
+            return {}
+
+        if len(self.attributes_include) > 0:
+            return {
+                attr: state.attributes[attr]
+                for attr in self.attributes_include
+                if attr in state.attributes and attr not in self.attributes_exclude
+            }
+
+        if len(self.attributes_exclude) > 0:
+            return {
+                attr: value
+                for attr, value in state.attributes.items()
+                if attr not in self.attributes_exclude
+            }
+
+        return dict(state.attributes)
+
+    # ------------------------------------------------------
+    @property
+    def upcoming_entity_ids(self) -> tuple[str, ...]:
+        """Entity ids of the upcoming entities."""
+        return tuple(self.upcoming)[:UPCOMING_SIZE]
+
+    # ------------------------------------------------------
+    @property
+    def visible_count(self) -> int:
+        """Number of visible entities."""
+
+        if self.has_show_if:
+            return len(self.visible_entity_ids)
+
+        return len(self.entities_list)
+
+    # ------------------------------------------------------
+    def as_dict(self) -> dict:
+        """Carousel statistics."""
+
+        return {
+            "entities": len(self.entities_list),
+            "visible_entities": self.visible_count,
+            "missing_entities": len(self.missing_entities),
+            "state_writes": self.state_writes,
+            "suppressed_writes": self.suppressed_writes,
+        }
@@ -2,36 +2,144 @@
 
 # ------------------------------------------------------
 # ------------------------------------------------------
+from __future__ import annotations
+
 from datetime import datetime, timedelta
 
 from homeassistant.core import State
-from homeassistant.helpers.entity import Entity
+from homeassistant.util import dt as dt_util
+
+from .member_hub import MemberInfo
 
 
 class BaseEntityInfo:
-    """Base entity info class."""
+    """Base entity info class.
+
+    Slotted, so one entity info per carousel member stays small. State and
+    derived info are read from the member info shared by all carousels, and the
+    rarely used show_x_times and remove_at are only allocated when set.
+    """
+
+    __slots__ = (
+        "_extra",
+        "entity_id",
+        "is_visible",
+        "member",
+        "template_last_updated",
+        "template_result",
+    )
 
     def __init__(
         self,
         entity_id: str,
-        friendly_name: str | None = None,
-        icon: str | None = None,
-        unit_of_measurement: str | None = None,
         show_x_times: int | None = None,
         remove_at_timedelta: timedelta | None = None,
     ) -> None:
         """Entity info base."""
         self.entity_id: str = entity_id
-        self.friendly_name: str | None = friendly_name
-        self.icon: str | None = icon
-        self.unit_of_measurement: str | None = unit_of_measurement
-        self.state: State = None
-        self.show_x_times: int = show_x_times
-        self.remove_at: datetime = None
+        self.member: MemberInfo | None = None
         self.is_visible: bool = True
+        self.template_result: bool = False
+        self.template_last_updated: datetime | None = None
+        self._extra: dict[str, int | datetime] | None = None
+
+        if show_x_times is not None:
+            self.show_x_times = show_x_times
 
         if remove_at_timedelta is not None:
-            self.remove_at = datetime.now() + remove_at_timedelta
+            self.remove_at = dt_util.utcnow() + remove_at_timedelta
+
+    # ------------------------------------------------------
+    @property
+    def state(self) -> State | None:
+        """State."""
+
+        if self.member is not None:
+            return self.member.state
+
+        return None
+
+    # ------------------------------------------------------
+    @property
+    def friendly_name(self) -> str | None:
+        """Friendly name."""
+
+        if self.member is not None:
+            return self.member.friendly_name
+
+        return None
+
+    # ------------------------------------------------------
+    @property
+    def icon(self) -> str | None:
+        """Icon."""
+
+        if self.member is not None:
+            return self.member.icon
+
+        return None
+
+    # ------------------------------------------------------
+    @property
+    def unit_of_measurement(self) -> str | None:
+        """Unit of measurement."""
+
+        if self.member is not None:
+            return self.member.unit_of_measurement
+
+        return None
+
+    # ------------------------------------------------------
+    @property
+    def device_class(self) -> str | None:
+        """Device class."""
+
+        if self.member is not None:
+            return self.member.device_class
+
+        return None
+
+    # ------------------------------------------------------
+    @property
+    def show_x_times(self) -> int | None:
+        """Show x times before removing."""
+
+        if self._extra is not None:
+            return self._extra.get("show_x_times")
+
+        return None
+
+    @show_x_times.setter
+    def show_x_times(self, value: int | None) -> None:
+        self._set_extra("show_x_times", value)
+
+    # ------------------------------------------------------
+    @property
+    def remove_at(self) -> datetime | None:
+        """Remove at."""
+
+        if self._extra is not None:
+            return self._extra.get("remove_at")
+
+        return None
+
+    @remove_at.setter
+    def remove_at(self, value: datetime | None) -> None:
+        self._set_extra("remove_at", value)
+
+    # ------------------------------------------------------
+    def _set_extra(self, key: str, value: int | datetime | None) -> None:
+        """Set sparse field."""
+
+        if value is None:
+            if self._extra is not None:
+                self._extra.pop(key, None)
+
+                if len(self._extra) == 0:
+                    self._extra = None
+            return
+
+        if self._extra is None:
+            self._extra = {}
 
-        self.entity_obj: Entity
-        self.device_class: str
+        self._extra[key] = value
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from homeassistant.components.binary_sensor import (
-    BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -14,6 +13,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .base_carousel_entity import BaseCarouselEntity
 from .base_entity_info import BaseEntityInfo
 from .const import CONF_ENTITY_IDS, TRANSLATION_KEY
+from .entity_info_list import EntityInfoList
 
 
 # ------------------------------------------------------
@@ -36,24 +36,7 @@ async def async_setup_entry(
 class BinarySensorEntityInfo(BaseEntityInfo):
     """Sensor Entity info class."""
 
-    def __init__(
-        self,
-        entity_id: str,
-        friendly_name: str | None = None,
-        icon: str | None = None,
-        unit_of_measurement: str | None = None,
-        device_class: BinarySensorDeviceClass | None = None,
-    ) -> None:
-        """Sensor entity info."""
-        super().__init__(
-            entity_id,
-            friendly_name,
-            icon,
-            unit_of_measurement,
-        )
-
-        self.device_class: BinarySensorDeviceClass | None = device_class
-        self.entity_obj: BinarySensorEntity
+    __slots__ = ()
 
 
 # ------------------------------------------------------
@@ -61,6 +44,8 @@ class BinarySensorEntityInfo(BaseEntityInfo):
 class CarouselBinarySensor(BinarySensorEntity, BaseCarouselEntity):
     """Binary sensor class for carousel."""
 
+    entity_info_class = BinarySensorEntityInfo
+
     # ------------------------------------------------------
     def __init__(
         self, hass: HomeAssistant, entry: ConfigEntry, entities: list[str]
@@ -71,9 +56,9 @@ class CarouselBinarySensor(BinarySensorEntity, BaseCarouselEntity):
             entry,
         )
 
-        self.entities_list: list[BinarySensorEntityInfo] = [
+        self.entities_list: EntityInfoList[BinarySensorEntityInfo] = EntityInfoList(
             BinarySensorEntityInfo(entity) for entity in entities
-        ]
+        )
 
         self.translation_key = TRANSLATION_KEY
 
@@ -82,7 +67,7 @@ class CarouselBinarySensor(BinarySensorEntity, BaseCarouselEntity):
     def is_on(self) -> bool:
         """Get the state."""
 
-        if self.current_entity is not None:
+        if self.current_entity is not None and self.current_entity.state is not None:
             return self.current_entity.state.state == "on"
 
         return None
@@ -14,6 +14,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .base_carousel_entity import BaseCarouselEntity
 from .base_entity_info import BaseEntityInfo
 from .const import CONF_ENTITY_IDS, TRANSLATION_KEY
+from .entity_info_list import EntityInfoList
 
 
 # ------------------------------------------------------
@@ -21,24 +22,7 @@ from .const import CONF_ENTITY_IDS, TRANSLATION_KEY
 class CameraEntityInfo(BaseEntityInfo):
     """Camera Entity info class."""
 
-    def __init__(
-        self,
-        entity_id: str,
-        friendly_name: str | None = None,
-        icon: str | None = None,
-        unit_of_measurement: str | None = None,
-        device_class: str | None = None,
-    ) -> None:
-        """Sensor entity info."""
-        super().__init__(
-            entity_id,
-            friendly_name,
-            icon,
-            unit_of_measurement,
-        )
-
-        self.device_class: str | None = device_class
-        self.entity_obj: Camera
+    __slots__ = ()
 
 
 # ------------------------------------------------------
@@ -61,6 +45,8 @@ async def async_setup_entry(
 class CarouselCamera(Camera, BaseCarouselEntity):
     """Camera carousel."""
 
+    entity_info_class = CameraEntityInfo
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -71,9 +57,9 @@ class CarouselCamera(Camera, BaseCarouselEntity):
         Camera.__init__(self)
         BaseCarouselEntity.__init__(self, hass, entry)
 
-        self.entities_list: list[CameraEntityInfo] = [
+        self.entities_list: EntityInfoList[CameraEntityInfo] = EntityInfoList(
             CameraEntityInfo(entity) for entity in entities
-        ]
+        )
 
         self.current_entity: CameraEntityInfo = None
 
@@ -85,29 +71,35 @@ class CarouselCamera(Camera, BaseCarouselEntity):
 
         await self.async_refresh_common()
 
-        self.current_entity = self.entities_list[
-            self.current_entity_pos
-        ] = await self.async_get_entity_info(self.current_entity)
-
-        if self.current_entity.entity_obj is not None:
+        if self.current_entity_obj is not None:
             self._attr_supported_features = (
-                self.current_entity.entity_obj._attr_supported_features
+                self.current_entity_obj._attr_supported_features
             )
-            self._attr_should_poll = self.current_entity.entity_obj._attr_should_poll
+            self._attr_should_poll = self.current_entity_obj._attr_should_poll
+
+    # ------------------------------------------------------
+    def state_fingerprint(self) -> tuple:
+        """Fingerprint of everything the written state is derived from."""
+
+        return (*super().state_fingerprint(), self._attr_supported_features)
+
+    # ------------------------------------------------------
+    @property
+    def current_entity_obj(self) -> Camera | None:
+        """Camera entity of the current entity."""
 
-        if self.async_write_ha_state is not None:
-            self.async_write_ha_state()
+        if self.current_entity is not None:
+            return self.platform.domain_entities.get(self.current_entity.entity_id)
+
+        return None
 
     # ------------------------------------------------------
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
 
-        if (
-            self.current_entity is not None
-            and self.current_entity.entity_obj is not None
-        ):
-            return self.current_entity.entity_obj.available
+        if self.current_entity_obj is not None:
+            return self.current_entity_obj.available
 
         return False
 
@@ -116,11 +108,8 @@ class CarouselCamera(Camera, BaseCarouselEntity):
     def frame_interval(self) -> float:
         """Return the interval between frames of the mjpeg stream."""
 
-        if (
-            self.current_entity is not None
-            and self.current_entity.entity_obj is not None
-        ):
-            return self.current_entity.entity_obj.frame_interval
+        if self.current_entity_obj is not None:
+            return self.current_entity_obj.frame_interval
 
         return 0
 
@@ -134,11 +123,10 @@ class CarouselCamera(Camera, BaseCarouselEntity):
         is to use HLS, and components can override to change the type.
         """
         if (
-            self.current_entity is not None
-            and self.current_entity.entity_obj is not None
-            and self.current_entity.entity_obj.frontend_stream_type is not None
+            self.current_entity_obj is not None
+            and self.current_entity_obj.frontend_stream_type is not None
         ):
-            return self.current_entity.entity_obj.frontend_stream_type()
+            return self.current_entity_obj.frontend_stream_type()
 
         return None
 
@@ -147,11 +135,8 @@ class CarouselCamera(Camera, BaseCarouselEntity):
     def model(self) -> str | None:
         """Return the camera model."""
 
-        if (
-            self.current_entity is not None
-            and self.current_entity.entity_obj is not None
-        ):
-            return self.current_entity.entity_obj.model
+        if self.current_entity_obj is not None:
+            return self.current_entity_obj.model
 
         return None
 
@@ -159,11 +144,8 @@ class CarouselCamera(Camera, BaseCarouselEntity):
     @property
     def use_stream_for_stills(self) -> bool:
         """Whether or not to use stream to generate stills."""
-        if (
-            self.current_entity is not None
-            and self.current_entity.entity_obj is not None
-        ):
-            return self.current_entity.entity_obj.use_stream_for_stills
+        if self.current_entity_obj is not None:
+            return self.current_entity_obj.use_stream_for_stills
 
         return False
 
@@ -172,11 +154,10 @@ class CarouselCamera(Camera, BaseCarouselEntity):
     # def supported_features(self) -> CameraEntityFeature:
     #     """Flag supported features."""
     #     if (
-    #         self.current_entity is not None
-    #         and self.current_entity.entity_obj is not None
-    #         and self.current_entity.entity_obj.supported_features is not None
+    #         self.current_entity_obj is not None
+    #         and self.current_entity_obj.supported_features is not None
     #     ):
-    #         return self.current_entity.entity_obj.supported_features
+    #         return self.current_entity_obj.supported_features
 
     #     return None
 
@@ -187,11 +168,10 @@ class CarouselCamera(Camera, BaseCarouselEntity):
         """Return bytes of camera image."""
 
         if (
-            self.current_entity is not None
-            and self.current_entity.entity_obj is not None
-            and self.current_entity.entity_obj.camera_image is not None
+            self.current_entity_obj is not None
+            and self.current_entity_obj.camera_image is not None
         ):
-            return self.current_entity.entity_obj.camera_image(width, height)
+            return self.current_entity_obj.camera_image(width, height)
 
         return None
 
@@ -200,11 +180,10 @@ class CarouselCamera(Camera, BaseCarouselEntity):
         """Return the stream source."""
 
         if (
-            self.current_entity is not None
-            and self.current_entity.entity_obj is not None
-            and self.current_entity.entity_obj.stream_source is not None
+            self.current_entity_obj is not None
+            and self.current_entity_obj.stream_source is not None
         ):
-            return await self.current_entity.entity_obj.stream_source()
+            return await self.current_entity_obj.stream_source()
 
         return None
 
@@ -215,13 +194,10 @@ class CarouselCamera(Camera, BaseCarouselEntity):
         """Camera image."""
 
         if (
-            self.current_entity is not None
-            and self.current_entity.entity_obj is not None
-            and self.current_entity.entity_obj.async_camera_image is not None
+            self.current_entity_obj is not None
+            and self.current_entity_obj.async_camera_image is not None
         ):
-            return await self.current_entity.entity_obj.async_camera_image(
-                width, height
-            )
+            return await self.current_entity_obj.async_camera_image(width, height)
 
         return None
 
@@ -231,12 +207,7 @@ class CarouselCamera(Camera, BaseCarouselEntity):
     ) -> web.StreamResponse | None:
         """Mjpeg stream."""
 
-        if (
-            self.current_entity is not None
-            and self.current_entity.entity_obj is not None
-        ):
-            return await self.current_entity.entity_obj.handle_async_mjpeg_stream(
-                request
-            )
+        if self.current_entity_obj is not None:
+            return await self.current_entity_obj.handle_async_mjpeg_stream(request)
 
         return None
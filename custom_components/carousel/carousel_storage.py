@@ -0,0 +1,36 @@
+"""Carousel storage."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY
+from .hass_util import StorageJson
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class CarouselStorage(StorageJson):
+    """Carousel storage class.
+
+    Dynamic membership and position of a carousel, kept across restarts.
+    Minor version 2 stores the schema fields instead of jsonpickle. Saves are
+    delayed, unchanged data is not written and changes are journaled.
+    """
+
+    schema_fields___ = ("current_entity_id", "added_entities", "removed_entity_ids")
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Carousel storage."""
+        super().__init__(
+            hass,
+            f"{DOMAIN}.{entry_id}",
+            minor_version=2,
+            save_delay=STORAGE_SAVE_DELAY,
+            skip_unchanged=True,
+            journal=True,
+        )
+
+        self.current_entity_id: str = ""
+        self.added_entities: list[dict] = []
+        self.removed_entity_ids: list[str] = []
@@ -23,19 +23,27 @@ from homeassistant.helpers.selector import (
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
+    ObjectSelector,
     TemplateSelector,
 )
 
 from .const import (
+    CONF_ALIGN_TO_CLOCK,
+    CONF_ATTRIBUTES_EXCLUDE,
+    CONF_ATTRIBUTES_INCLUDE,
     CONF_ENTITY_IDS,
     CONF_LISTEN_TO_TIMER_TRIGGER,
+    CONF_MIN_WRITE_INTERVAL,
     CONF_PLATFORM_TYPE,
     CONF_RESTART_TIMER,
     CONF_ROTATE_EVERY_MINUTES,
+    CONF_SHOW_IF_FILTER,
     CONF_SHOW_IF_TEMPLATE,
+    CONF_USE_TIMER_WHEEL,
     DOMAIN,
     StepType,
 )
+from .show_if_filter import ShowIfFilterError, compile_show_if_filter
 
 
 async def _validate_input(
@@ -92,6 +100,38 @@ async def _create_form(
             CONF_RESTART_TIMER,
             default=False,
         ): BooleanSelector(),
+        vol.Optional(
+            CONF_USE_TIMER_WHEEL,
+            default=False,
+        ): BooleanSelector(),
+        vol.Optional(
+            CONF_ALIGN_TO_CLOCK,
+            default=False,
+        ): BooleanSelector(),
+        vol.Optional(
+            CONF_MIN_WRITE_INTERVAL,
+            default=0,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=3600,
+                step="any",
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="seconds",
+            )
+        ),
+        vol.Optional(
+            CONF_ATTRIBUTES_INCLUDE,
+            default=[],
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(options=[], multiple=True, custom_value=True)
+        ),
+        vol.Optional(
+            CONF_ATTRIBUTES_EXCLUDE,
+            default=[],
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(options=[], multiple=True, custom_value=True)
+        ),
     }
 
     CONFIG_OPTIONS_ENTITIES = {
@@ -103,6 +143,9 @@ async def _create_form(
         ),
     }
     CONFIG_SHOW_IF_TEMPLATE = {
+        vol.Optional(
+            CONF_SHOW_IF_FILTER,
+        ): ObjectSelector(),
         vol.Optional(
             CONF_SHOW_IF_TEMPLATE,
         ): TemplateSelector(),
@@ -161,6 +204,12 @@ async def _validate_input(
     if len(user_input[CONF_ENTITY_IDS]) == 0:
         raise SchemaFlowError("missing_selection")
 
+    if user_input.get(CONF_SHOW_IF_FILTER):
+        try:
+            compile_show_if_filter(user_input[CONF_SHOW_IF_FILTER])
+        except ShowIfFilterError as err:
+            raise SchemaFlowError("invalid_show_if_filter") from err
+
     return user_input
 
 
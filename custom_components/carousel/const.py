@@ -7,6 +7,9 @@ DOMAIN = "carousel"
 DOMAIN_NAME = "Carousel"
 LOGGER: Logger = getLogger(__name__)
 
+DATA_MEMBER_HUB = DOMAIN + "_member_hub"
+DATA_CAROUSELS = DOMAIN + "_carousels"
+
 TRANSLATION_KEY = DOMAIN
 TRANSLATION_KEY_MISSING_ENTITY = "missing_entity"
 TRANSLATION_KEY_MISSING__TIMER_ENTITY = "missing_timer_entity"
@@ -17,7 +20,13 @@ CONF_ROTATE_EVERY_MINUTES = "rotate_every_minutes"
 CONF_PLATFORM_TYPE = "platform_type"
 CONF_RESTART_TIMER = "restart_timer"
 CONF_LISTEN_TO_TIMER_TRIGGER = "listen_to_timer_trigger"
+CONF_USE_TIMER_WHEEL = "use_timer_wheel"
+CONF_ALIGN_TO_CLOCK = "align_to_clock"
 CONF_SHOW_IF_TEMPLATE = "show_if_template"
+CONF_SHOW_IF_FILTER = "show_if_filter"
+CONF_MIN_WRITE_INTERVAL = "min_write_interval"
+CONF_ATTRIBUTES_INCLUDE = "attributes_include"
+CONF_ATTRIBUTES_EXCLUDE = "attributes_exclude"
 
 SERVICE_SHOW_ENTITY_ID = "show_entity_id"
 SERVICE_REMOVE_ENTITY_ID = "remove_entity_id"
@@ -27,6 +36,9 @@ SERVICE_SHOW_FOR = "show_for"
 
 EVENT_STARTING_OVER = "starting_over"
 
+UPCOMING_SIZE = 5
+STORAGE_SAVE_DELAY = 10
+
 
 class StepType(StrEnum):
     """Available entity component types."""
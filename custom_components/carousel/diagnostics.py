@@ -0,0 +1,47 @@
+"""Diagnostics support for Carousel."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_CAROUSELS, DATA_MEMBER_HUB
+from .hass_util.timer_trigger import (
+    DATA_TIMER_FINISHED_DISPATCHER,
+    TimerFinishedDispatcher,
+)
+from .hass_util.timer_wheel import DATA_TIMER_WHEEL, TimerWheel
+from .member_hub import MemberHub
+
+
+# ------------------------------------------------------------------
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    The shared helpers are only read, so diagnostics of an unloaded entry do
+    not create them.
+    """
+
+    carousel = hass.data.get(DATA_CAROUSELS, {}).get(entry.entry_id)
+    member_hub: MemberHub | None = hass.data.get(DATA_MEMBER_HUB)
+    timer_wheel: TimerWheel | None = hass.data.get(DATA_TIMER_WHEEL)
+    dispatcher: TimerFinishedDispatcher | None = hass.data.get(
+        DATA_TIMER_FINISHED_DISPATCHER
+    )
+
+    return {
+        "options": dict(entry.options),
+        "carousel": carousel.as_dict() if carousel is not None else None,
+        "member_hub": {
+            "members": len(member_hub.members),
+            "icon_cache": member_hub.icon_cache.as_dict(),
+        }
+        if member_hub is not None
+        else None,
+        "timer_wheel": timer_wheel.as_dict() if timer_wheel is not None else None,
+        "timer_finished": dispatcher.as_dict() if dispatcher is not None else None,
+    }
@@ -0,0 +1,180 @@
+"""Entity info list class."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Generic, TypeVar
+
+from .base_entity_info import BaseEntityInfo
+
+_EntityInfoT = TypeVar("_EntityInfoT", bound=BaseEntityInfo)
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class EntityInfoList(Generic[_EntityInfoT]):
+    """Ordered list of entity infos indexed by entity id.
+
+    Removing an entity info leaves an empty slot behind, so the position of the
+    remaining entity infos is stable. The empty slots are dropped by compact().
+    """
+
+    def __init__(self, entity_infos: Iterable[_EntityInfoT] = ()) -> None:
+        """Init."""
+        self._slots: list[_EntityInfoT | None] = []
+        self._index: dict[str, int] = {}
+
+        for entity_info in entity_infos:
+            self.append(entity_info)
+
+    # ------------------------------------------------------
+    def __len__(self) -> int:
+        """Number of entity infos."""
+        return len(self._index)
+
+    # ------------------------------------------------------
+    def __iter__(self) -> Iterator[_EntityInfoT]:
+        """Iterate entity infos in order."""
+        return (entity_info for entity_info in self._slots if entity_info is not None)
+
+    # ------------------------------------------------------
+    def __contains__(self, entity_id: object) -> bool:
+        """Entity id in list."""
+        return entity_id in self._index
+
+    # ------------------------------------------------------
+    def __getitem__(self, pos: int) -> _EntityInfoT | None:
+        """Entity info at slot pos. None if the slot is empty."""
+        return self._slots[pos]
+
+    # ------------------------------------------------------
+    @property
+    def slot_count(self) -> int:
+        """Number of slots, including empty slots."""
+        return len(self._slots)
+
+    # ------------------------------------------------------
+    @property
+    def needs_compaction(self) -> bool:
+        """More than half of the slots are empty."""
+        return len(self._slots) > 2 * len(self._index) + 8
+
+    # ------------------------------------------------------
+    def entity_ids(self) -> list[str]:
+        """Entity ids in order."""
+        return [entity_info.entity_id for entity_info in self]
+
+    # ------------------------------------------------------
+    def get(self, entity_id: str) -> _EntityInfoT | None:
+        """Get entity info by entity id."""
+
+        if (pos := self._index.get(entity_id, -1)) > -1:
+            return self._slots[pos]
+
+        return None
+
+    # ------------------------------------------------------
+    def find_pos(self, entity_id: str) -> int:
+        """Find slot pos of entity id. -1 if not found."""
+        return self._index.get(entity_id, -1)
+
+    # ------------------------------------------------------
+    def append(self, entity_info: _EntityInfoT) -> bool:
+        """Append entity info. False if the entity id is already in the list."""
+
+        if entity_info.entity_id in self._index:
+            return False
+
+        self._index[entity_info.entity_id] = len(self._slots)
+        self._slots.append(entity_info)
+        return True
+
+    # ------------------------------------------------------
+    def remove(self, entity_id: str) -> _EntityInfoT | None:
+        """Remove entity info by entity id."""
+
+        if (pos := self._index.pop(entity_id, -1)) == -1:
+            return None
+
+        entity_info = self._slots[pos]
+        self._slots[pos] = None
+
+        if len(self._index) == 0:
+            self._slots.clear()
+
+        return entity_info
+
+    # ------------------------------------------------------
+    def remove_at(self, pos: int) -> _EntityInfoT | None:
+        """Remove entity info at slot pos."""
+
+        if 0 <= pos < len(self._slots) and self._slots[pos] is not None:
+            return self.remove(self._slots[pos].entity_id)
+
+        return None
+
+    # ------------------------------------------------------
+    def next_pos(self, pos: int, include_pos: bool = False) -> int:
+        """Slot pos of the next entity info after pos, wrapping around.
+
+        With include_pos, pos itself is returned if the slot is not empty.
+        Returns -1 if the list is empty.
+        """
+
+        if len(self._index) == 0:
+            return -1
+
+        slot_count: int = len(self._slots)
+        start: int = pos if include_pos else pos + 1
+
+        for offset in range(slot_count):
+            tmp_pos = (start + offset) % slot_count
+
+            if self._slots[tmp_pos] is not None:
+                return tmp_pos
+
+        return -1
+
+    # ------------------------------------------------------
+    def prev_pos(self, pos: int) -> int:
+        """Slot pos of the entity info before pos, wrapping around.
+
+        Returns -1 if the list is empty.
+        """
+
+        if len(self._index) == 0:
+            return -1
+
+        slot_count: int = len(self._slots)
+
+        for offset in range(1, slot_count + 1):
+            tmp_pos = (pos - offset) % slot_count
+
+            if self._slots[tmp_pos] is not None:
+                return tmp_pos
+
+        return -1
+
+    # ------------------------------------------------------
+    def compact(self, pos: int = -1) -> int:
+        """Drop empty slots.
+
+        Returns the new slot pos for pos. If the slot at pos is empty, the pos of
+        the next entity info is returned.
+        """
+
+        new_pos: int = -1 if pos < 0 else 0
+        slots: list[_EntityInfoT] = []
+
+        for tmp_pos, entity_info in enumerate(self._slots):
+            if entity_info is None:
+                continue
+
+            if tmp_pos < pos:
+                new_pos += 1
+
+            self._index[entity_info.entity_id] = len(slots)
+            slots.append(entity_info)
+
+        self._slots = slots
+        return new_pos
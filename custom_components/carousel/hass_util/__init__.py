@@ -5,8 +5,9 @@ It includes functions for handling retries, managing timers, and translating tex
 
 External imports:
     handle_retries: None
-    storage_json: jsonpickle
+    storage_json: jsonpickle (only without schema fields)
     timer_trigger: None
+    timer_wheel: None
     translate: aiofiles, orjson
 """
 
@@ -24,6 +25,11 @@ from .hass_util import (  # noqa: F401
     async_hass_add_executor_job,
 )
 from .json_ext import DictToObject, JsonExt  # noqa: F401
-from .storage_json import StorageJson, StoreMigrate  # noqa: F401
-from .timer_trigger import TimerTrigger, TimerTriggerErrorEnum  # noqa: F401
+from .storage_json import StorageJson, StoreJournal, StoreMigrate  # noqa: F401
+from .timer_trigger import (  # noqa: F401
+    TimerFinishedDispatcher,
+    TimerTrigger,
+    TimerTriggerErrorEnum,
+)
+from .timer_wheel import TimerWheel  # noqa: F401
 from .translate import NumberSelectorConfigTranslate, Translate  # noqa: F401
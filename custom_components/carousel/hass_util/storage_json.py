@@ -1,17 +1,35 @@
 """Json storage.
 
-External imports: jsonpickle
+External imports: jsonpickle (only without schema fields)
 """
 
 from collections.abc import Callable
+from functools import cache
 import inspect
 from typing import Any
 
-import jsonpickle
-
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
 
+DICT_KEY_DATA = "data"
+DICT_KEY_GENERATION = "journal_generation"
+DICT_KEY_JSONPICKLE = "jsonpickle"
+DICT_KEY_RECORDS = "records"
+DICT_KEY_SCHEMA = "schema"
+JOURNAL_MAX_RECORDS = 100
+
+
+# ------------------------------------------------------------------
+@cache
+def _jsonpickle():
+    """Import jsonpickle when first needed and set the encoder options once."""
+
+    import jsonpickle  # noqa: PLC0415
+
+    jsonpickle.set_encoder_options("json", ensure_ascii=False)
+    return jsonpickle
+
 
 # ------------------------------------------------------------------
 # ------------------------------------------------------------------
@@ -19,6 +37,7 @@ class StoreMigrate(Store):
     """When migration storage layout."""
 
     custom_migrate_func: Callable[[int, int, Any], Any] | None = None
+    schema_fields: tuple[str, ...] = ()
 
     # ------------------------------------------------------------------
     async def _async_migrate_func(
@@ -27,7 +46,18 @@ class StoreMigrate(Store):
         old_minor_version: int,
         old_data: Any,
     ) -> Any:
-        """Migrate to the new version."""
+        """Migrate to the new version.
+
+        Data written by jsonpickle is converted to the schema layout first, when
+        schema fields are declared.
+        """
+
+        if (
+            len(self.schema_fields) > 0
+            and isinstance(old_data, dict)
+            and DICT_KEY_JSONPICKLE in old_data
+        ):
+            old_data = self.migrate_jsonpickle(old_data)
 
         if self.custom_migrate_func is not None:
             if inspect.iscoroutinefunction(self.custom_migrate_func):
@@ -40,6 +70,204 @@ class StoreMigrate(Store):
             )
         return old_data
 
+    # ------------------------------------------------------------------
+    def migrate_jsonpickle(self, old_data: dict) -> dict:
+        """Convert jsonpickle data to the schema layout."""
+
+        new_data: dict = {
+            key: value for key, value in old_data.items() if key != DICT_KEY_JSONPICKLE
+        }
+        tmp_obj = _jsonpickle().decode(old_data[DICT_KEY_JSONPICKLE])
+        tmp_dict: dict = getattr(tmp_obj, "__dict__", {})
+
+        new_data[DICT_KEY_SCHEMA] = {
+            field: tmp_dict[field] for field in self.schema_fields if field in tmp_dict
+        }
+        return new_data
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class StoreJournal:
+    """Journal of the changed schema fields of a store.
+
+    The journal is a second store next to the store, holding the schema fields
+    differing from the store, so a change of a small field writes a small
+    file. The store is only written in full every max_records journal writes.
+
+    Store and journal carry a generation. A full write starts a new
+    generation, and a journal is only applied to the store of its own
+    generation, so a journal left behind by an interrupted compaction is
+    ignored instead of replayed over newer data.
+    """
+
+    def __init__(self, store: Store, max_records: int = JOURNAL_MAX_RECORDS) -> None:
+        """Init."""
+
+        self.store: Store = store
+        self.journal_store: Store = Store(store.hass, 1, store.key + ".journal")
+        self.max_records: int = max_records
+
+        self.generation: int | None = None
+        self.records: int = 0
+        self.field_hashes: dict[str, int] = {}
+        self.payload_hash: int | None = None
+        self.journal_fields: int = 0
+
+    # ------------------------------------------------------------------
+    @property
+    def compact_due(self) -> bool:
+        """The store must be written in full."""
+        return self.generation is None or self.records >= self.max_records
+
+    # ------------------------------------------------------------------
+    def unchanged(self, payload: dict) -> bool:
+        """Payload equals the data in the store and journal."""
+        return hash(json_bytes(payload)) == self.payload_hash
+
+    # ------------------------------------------------------------------
+    def changed_fields(self, payload: dict) -> dict:
+        """Schema fields of payload differing from the store."""
+
+        return {
+            field: value
+            for field, value in payload[DICT_KEY_SCHEMA].items()
+            if self.field_hashes.get(field) != hash(json_bytes(value))
+        }
+
+    # ------------------------------------------------------------------
+    async def async_load(self, data: Any) -> Any:
+        """Load the journal of the generation of the loaded data, and apply it."""
+
+        if not isinstance(data, dict) or DICT_KEY_SCHEMA not in data:
+            return data
+
+        generation: int = data.get(DICT_KEY_GENERATION, 0)
+        data = {key: value for key, value in data.items() if key != DICT_KEY_GENERATION}
+        self.set_stored(generation, data)
+
+        journal: Any = await self.journal_store.async_load()
+
+        if isinstance(journal, dict) and journal.get(DICT_KEY_GENERATION) == generation:
+            journal_data: dict = journal[DICT_KEY_DATA]
+            data.update(
+                {
+                    key: value
+                    for key, value in journal_data.items()
+                    if key != DICT_KEY_SCHEMA
+                }
+            )
+            data[DICT_KEY_SCHEMA] = {
+                **data[DICT_KEY_SCHEMA],
+                **journal_data[DICT_KEY_SCHEMA],
+            }
+            self.records = journal[DICT_KEY_RECORDS]
+            self.journal_fields = len(journal_data[DICT_KEY_SCHEMA])
+
+        self.payload_hash = hash(json_bytes(data))
+        return data
+
+    # ------------------------------------------------------------------
+    async def async_save(self, payload: dict, skip_unchanged: bool) -> None:
+        """Write payload to the journal, or to the store in full."""
+
+        if skip_unchanged and self.unchanged(payload):
+            return
+
+        if self.compact_due:
+            await self.store.async_save(self.full_data(payload))
+        elif len(self.changed_fields(payload)) == 0:
+            await self.async_clear(payload)
+        else:
+            await self.journal_store.async_save(self.journal_data(payload))
+
+    # ------------------------------------------------------------------
+    async def async_clear(self, payload: dict) -> None:
+        """Payload equals the store, remove the journal instead of writing it."""
+
+        if self.journal_fields > 0:
+            await self.journal_store.async_remove()
+            self.journal_fields = 0
+
+        self.payload_hash = hash(json_bytes(payload))
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_delay_save(
+        self,
+        data_func: Callable[[], dict],
+        delay: float,
+        payload: dict | None = None,
+    ) -> bool:
+        """Write the payload of data_func to the journal after delay.
+
+        The store is written in full instead, if a compaction is due. With the
+        current payload given, nothing is scheduled if it is unchanged, and the
+        journal is removed at once if the payload equals the store. Returns
+        True if a write is scheduled.
+        """
+
+        if payload is not None and not self.compact_due:
+            if self.unchanged(payload):
+                return False
+
+            if len(self.changed_fields(payload)) == 0:
+                self.store.hass.async_create_task(self.async_clear(payload))
+                return False
+
+        if self.compact_due:
+            self.store.async_delay_save(lambda: self.full_data(data_func()), delay)
+        else:
+            self.journal_store.async_delay_save(
+                lambda: self.journal_data(data_func()), delay
+            )
+
+        return True
+
+    # ------------------------------------------------------------------
+    def full_data(self, payload: dict) -> dict:
+        """Store data for payload, starting a new generation."""
+
+        self.set_stored((self.generation or 0) + 1, payload)
+        self.payload_hash = hash(json_bytes(payload))
+        return {**payload, DICT_KEY_GENERATION: self.generation}
+
+    # ------------------------------------------------------------------
+    def journal_data(self, payload: dict) -> dict:
+        """Journal data for payload, the schema fields differing from the store."""
+
+        changed: dict = self.changed_fields(payload)
+        self.records += 1
+        self.journal_fields = len(changed)
+        self.payload_hash = hash(json_bytes(payload))
+
+        return {
+            DICT_KEY_GENERATION: self.generation,
+            DICT_KEY_RECORDS: self.records,
+            DICT_KEY_DATA: {**payload, DICT_KEY_SCHEMA: changed},
+        }
+
+    # ------------------------------------------------------------------
+    def set_stored(self, generation: int, payload: dict) -> None:
+        """Remember the generation and field hashes of the store."""
+
+        self.generation = generation
+        self.records = 0
+        self.journal_fields = 0
+        self.field_hashes = {
+            field: hash(json_bytes(value))
+            for field, value in payload[DICT_KEY_SCHEMA].items()
+        }
+
+    # ------------------------------------------------------------------
+    async def async_remove(self) -> None:
+        """Remove the journal."""
+
+        await self.journal_store.async_remove()
+        self.generation = self.payload_hash = None
+        self.records = self.journal_fields = 0
+        self.field_hashes = {}
+
 
 # ------------------------------------------------------------------
 # ------------------------------------------------------------------
@@ -48,9 +276,20 @@ class StorageJson:
 
     This class is used to store data in a json file.
 
-    External imports: jsonpickle
+    Subclasses declaring schema_fields___ store only those attributes, as plain
+    json values written by the store through orjson. The values must be json
+    serializable. Other subclasses are stored through jsonpickle.
+
+    async_schedule_save writes after save_delay, so changes made meanwhile are
+    one write. With skip_unchanged, unchanged data is not written, and with
+    journal, changed schema fields are written to a StoreJournal, which is
+    compacted into the store every JOURNAL_MAX_RECORDS writes.
+
+    External imports: jsonpickle (only without schema fields)
     """
 
+    schema_fields___: tuple[str, ...] = ()
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -58,10 +297,13 @@ class StorageJson:
         version: int = 1,
         minor_version: int = 1,
         async_migrate_func: Callable[[int, int, Any], Any] | None = None,
+        save_delay: float = 0,
+        skip_unchanged: bool = False,
+        journal: bool = False,
     ) -> None:
         """Init."""
 
-        self.DICT_KEY___ = "jsonpickle"
+        self.DICT_KEY___ = DICT_KEY_JSONPICKLE
         self.write_hidden_attributes___: bool = False
         self.hass___ = hass
         self.store___ = StoreMigrate(
@@ -71,6 +313,16 @@ class StorageJson:
             minor_version=minor_version,
         )
         self.store___.custom_migrate_func = async_migrate_func
+        self.store___.schema_fields = self.schema_fields___
+        self.journal___: StoreJournal | None = (
+            StoreJournal(self.store___)
+            if journal and len(self.schema_fields___) > 0
+            else None
+        )
+        self.skip_unchanged___: bool = skip_unchanged
+        self.payload_hash___: int | None = None
+        self.save_delay___: float = save_delay
+        self.save_scheduled___: bool = False
         self.base_class___ = self.__class__ is StorageJson
 
     # ------------------------------------------------------------------
@@ -81,12 +333,20 @@ class StorageJson:
 
         data = await self.store___.async_load()
 
+        if self.journal___ is not None:
+            data = await self.journal___.async_load(data)
+        elif self.skip_unchanged___ and data is not None:
+            self.payload_hash___ = hash(json_bytes(data))
+
         if data is None:
             return None
 
+        if type(data) is dict and DICT_KEY_SCHEMA in data:
+            self.decode_schema(data.pop(DICT_KEY_SCHEMA))
+            return data if len(data) > 0 else None
+
         if type(data) is dict:
             if self.DICT_KEY___ in data:
-                jsonpickle.set_encoder_options("json", ensure_ascii=False)
                 tmp_obj = self.decode_data(data[self.DICT_KEY___])
                 del data[self.DICT_KEY___]
 
@@ -105,32 +365,123 @@ class StorageJson:
     # ------------------------------------------------------------------
     def decode_data(self, data: Any):
         """Decode data."""
-        return jsonpickle.decode(data)
+        return _jsonpickle().decode(data)
+
+    # ------------------------------------------------------------------
+    def decode_schema(self, data: dict) -> None:
+        """Set the schema fields from stored data."""
+
+        for field in self.schema_fields___:
+            if field in data:
+                setattr(self, field, data[field])
+
+    # ------------------------------------------------------------------
+    def encode_schema(self) -> dict:
+        """Schema fields to store."""
+        return {field: getattr(self, field) for field in self.schema_fields___}
 
     # ------------------------------------------------------------------
     async def async_write_settings(self, extra_data: dict = {}) -> None:
         """Write settings."""
 
-        jsonpickle.set_encoder_options("json", ensure_ascii=False)
+        self.save_scheduled___ = False
+        data: dict = self.data_to_save(extra_data)
 
-        if self.base_class___:
-            await self.store___.async_save(extra_data)
+        if self.journal___ is not None:
+            await self.journal___.async_save(data, self.skip_unchanged___)
+            return
 
-        else:
-            await self.store___.async_save(
-                {self.DICT_KEY___: self.encode_data(self), **extra_data}
+        if self.skip_unchanged___:
+            payload_hash: int = hash(json_bytes(data))
+
+            if payload_hash == self.payload_hash___:
+                return
+
+            self.payload_hash___ = payload_hash
+
+        await self.store___.async_save(data)
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_schedule_save(
+        self,
+        extra_data: dict | None = None,
+        update: Callable[[], None] | None = None,
+    ) -> None:
+        """Write settings after the save delay.
+
+        The settings are encoded when written, after calling update, so changes
+        made until then are included in the same write. Scheduling again before
+        the write does not postpone it. With skip_unchanged, nothing is
+        scheduled if the settings equal the last written settings.
+        """
+
+        if self.save_scheduled___:
+            return
+
+        data: dict | None = None
+
+        if self.skip_unchanged___:
+            if update is not None:
+                update()
+
+            data = self.data_to_save(extra_data or {})
+
+            if self.journal___ is None and hash(json_bytes(data)) == (
+                self.payload_hash___
+            ):
+                return
+
+        def data_func() -> dict:
+            self.save_scheduled___ = False
+
+            if update is not None:
+                update()
+
+            data: dict = self.data_to_save(extra_data or {})
+
+            if self.skip_unchanged___ and self.journal___ is None:
+                self.payload_hash___ = hash(json_bytes(data))
+
+            return data
+
+        if self.journal___ is not None:
+            self.save_scheduled___ = self.journal___.async_delay_save(
+                data_func, self.save_delay___, data
             )
+            return
+
+        self.save_scheduled___ = True
+        self.store___.async_delay_save(data_func, self.save_delay___)
+
+    # ------------------------------------------------------------------
+    def data_to_save(self, extra_data: dict) -> dict:
+        """Data to save."""
+
+        if self.base_class___:
+            return extra_data
+
+        if len(self.schema_fields___) > 0:
+            return {DICT_KEY_SCHEMA: self.encode_schema(), **extra_data}
+
+        return {self.DICT_KEY___: self.encode_data(self), **extra_data}
 
     # ------------------------------------------------------------------
     def encode_data(self, data: Any):
         """Encode data."""
-        return jsonpickle.encode(data, unpicklable=True)
+        return _jsonpickle().encode(data, unpicklable=True)
 
     # ------------------------------------------------------------------
     async def async_remove_settings(self) -> None:
         """Remove settings."""
+
         await self.store___.async_remove()
 
+        if self.journal___ is not None:
+            await self.journal___.async_remove()
+
+        self.payload_hash___ = None
+
     # ------------------------------------------------------------------
     def __getstate__(self) -> dict:
         """Get state."""
@@ -138,6 +489,7 @@ class StorageJson:
         del tmp_dict["write_hidden_attributes___"]
         del tmp_dict["hass___"]
         del tmp_dict["store___"]
+        del tmp_dict["journal___"]
         del tmp_dict["DICT_KEY___"]
         del tmp_dict["base_class___"]
 
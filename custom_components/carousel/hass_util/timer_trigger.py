@@ -3,17 +3,31 @@
 External imports: None
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from enum import Enum
 import inspect
+from typing import Any
 
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import Event, State, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import start
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import Callable, dt as dt_util
 
+from .timer_wheel import TimerWheel, next_aligned_time
+
+DATA_TIMER_FINISHED_DISPATCHER = __name__ + ".timer_finished_dispatcher"
+EVENT_TIMER_FINISHED = "timer.finished"
+
 # ------------------------------------------------------
 # ------------------------------------------------------
 
@@ -32,17 +46,176 @@ class TimerTriggerErrorEnum(Enum):
         return self != TimerTriggerErrorEnum.NONE
 
 
+# ------------------------------------------------------
+# ------------------------------------------------------
+class TimerFinishedDispatcher:
+    """Timer finished dispatcher class.
+
+    One bus listener for timer.finished, with an event filter, dispatching to
+    the listeners of the finished timer entity only.
+
+    Also restarts timer entities in background tasks, one at a time per timer
+    entity. Restart requests made before a pending restart of the timer runs
+    are served by its one service call. Failed restarts are kept per timer.
+
+    External imports: None
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.listeners: dict[str, list[HassJob]] = {}
+        self.unsub_bus: CALLBACK_TYPE | None = None
+
+        self.restart_locks: dict[str, asyncio.Lock] = {}
+        self.restart_pending: set[str] = set()
+        self.restart_errors: dict[str, str] = {}
+        self.restarts: int = 0
+        self.restart_requests: int = 0
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    @callback
+    def async_get(hass: HomeAssistant) -> "TimerFinishedDispatcher":
+        """Get the dispatcher, create it if needed."""
+
+        if (dispatcher := hass.data.get(DATA_TIMER_FINISHED_DISPATCHER)) is None:
+            dispatcher = hass.data[DATA_TIMER_FINISHED_DISPATCHER] = (
+                TimerFinishedDispatcher(hass)
+            )
+
+        return dispatcher
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_add_listener(
+        self, timer_entity: str, action: Callable[[Event], Any]
+    ) -> CALLBACK_TYPE:
+        """Call action when the timer entity finishes. Returns the remove callback."""
+
+        job: HassJob = HassJob(action)
+        self.listeners.setdefault(timer_entity, []).append(job)
+
+        if self.unsub_bus is None:
+            self.unsub_bus = self.hass.bus.async_listen(
+                EVENT_TIMER_FINISHED,
+                self.async_dispatch,
+                event_filter=self.async_filter,
+            )
+
+        @callback
+        def async_remove_listener() -> None:
+            self.async_remove_listener(timer_entity, job)
+
+        return async_remove_listener
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_remove_listener(self, timer_entity: str, job: HassJob) -> None:
+        """Remove listener, and the bus listener when the last is removed."""
+
+        if job in (jobs := self.listeners.get(timer_entity, [])):
+            jobs.remove(job)
+
+        if len(jobs) == 0:
+            self.listeners.pop(timer_entity, None)
+            self.restart_errors.pop(timer_entity, None)
+
+            if (
+                lock := self.restart_locks.get(timer_entity)
+            ) is not None and not lock.locked():
+                del self.restart_locks[timer_entity]
+
+        if len(self.listeners) == 0 and self.unsub_bus is not None:
+            self.unsub_bus()
+            self.unsub_bus = None
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_filter(self, event_data: dict[str, Any]) -> bool:
+        """Filter timer finished events of timers without listeners."""
+        return event_data.get(ATTR_ENTITY_ID) in self.listeners
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_dispatch(self, event: Event) -> None:
+        """Dispatch timer finished to the listeners of the timer."""
+
+        for job in list(self.listeners.get(event.data[ATTR_ENTITY_ID], [])):
+            self.hass.async_run_hass_job(job, event)
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_request_restart(self, timer_entity: str) -> None:
+        """Request restart of the timer entity, without waiting for it."""
+
+        self.restart_requests += 1
+
+        if timer_entity in self.restart_pending:
+            return
+
+        self.restart_pending.add(timer_entity)
+        self.hass.async_create_background_task(
+            self.async_restart(timer_entity), f"Restart {timer_entity}"
+        )
+
+    # ------------------------------------------------------------------
+    async def async_restart(self, timer_entity: str) -> None:
+        """Restart the timer entity if idle."""
+
+        lock: asyncio.Lock = self.restart_locks.setdefault(timer_entity, asyncio.Lock())
+
+        async with lock:
+            self.restart_pending.discard(timer_entity)
+
+            if (
+                state := self.hass.states.get(timer_entity)
+            ) is None or state.state != "idle":
+                return
+
+            try:
+                await self.hass.services.async_call(
+                    "timer",
+                    "start",
+                    service_data={ATTR_ENTITY_ID: timer_entity},
+                    blocking=True,
+                )
+            except Exception as err:  # noqa: BLE001
+                self.restart_errors[timer_entity] = str(err) or type(err).__name__
+            else:
+                self.restarts += 1
+                self.restart_errors.pop(timer_entity, None)
+
+    # ------------------------------------------------------------------
+    def as_dict(self) -> dict[str, Any]:
+        """Diagnostics."""
+
+        return {
+            "listeners": {
+                timer_entity: len(jobs) for timer_entity, jobs in self.listeners.items()
+            },
+            "restart_requests": self.restart_requests,
+            "restarts": self.restarts,
+            "restart_errors": dict(self.restart_errors),
+        }
+
+
 # ------------------------------------------------------
 # ------------------------------------------------------
 class TimerTrigger:
     """Timer trigger class.
 
+    With use_timer_wheel, the duration is scheduled on the domain wide timer
+    wheel, shared with the other timer triggers. With align_to_clock, the
+    trigger fires at whole multiples of the duration from the epoch, e.g. every
+    whole minute, so time spent in the callback does not add up as drift, and
+    ticks missed meanwhile are coalesced. The timer wheel is always aligned.
+
     External imports: None
 
     """
 
-    restarting_timer: bool = False
-
     def __init__(
         self,
         entity: Entity,
@@ -50,15 +223,12 @@ class TimerTrigger:
         duration: timedelta | None = None,
         callback_trigger: Callable[[TimerTriggerErrorEnum], None] = None,
         auto_restart: bool = True,
+        use_timer_wheel: bool = False,
+        align_to_clock: bool = False,
     ) -> None:
         """Init."""
 
-        if (timer_entity == "" and duration is None) or (
-            timer_entity == ""
-            and duration is not None
-            and duration.total_seconds() <= 0
-        ):
-            raise ValueError("timer_entity or duration must be provided")
+        self.validate_options(timer_entity, duration)
 
         if callback_trigger is None:
             raise ValueError("callback_trigger must be provided")
@@ -70,14 +240,67 @@ class TimerTrigger:
             callback_trigger
         )
         self.auto_restart: bool = auto_restart
+        self.use_timer_wheel: bool = use_timer_wheel
+        self.align_to_clock: bool = align_to_clock
 
         self.error: TimerTriggerErrorEnum = TimerTriggerErrorEnum.NONE
         self.timer_state: State
         self.unsub_async_track_point_in_utc_time: Callable[[], None] | None = None
+        self.unsub_timer_finished: Callable[[], None] | None = None
 
         self.entity.async_on_remove(
             start.async_at_started(self.entity.hass, self.async_hass_started)
         )
+        self.entity.async_on_remove(self.async_remove_from_hass)
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def validate_options(timer_entity: str, duration: timedelta | None) -> None:
+        """Validate options."""
+
+        if (timer_entity == "" and duration is None) or (
+            timer_entity == ""
+            and duration is not None
+            and duration.total_seconds() <= 0
+        ):
+            raise ValueError("timer_entity or duration must be provided")
+
+    # ------------------------------------------------------------------
+    async def async_set_options(
+        self,
+        timer_entity: str = "",
+        duration: timedelta | None = None,
+        auto_restart: bool = True,
+        use_timer_wheel: bool = False,
+        align_to_clock: bool = False,
+    ) -> None:
+        """Set options on the running timer trigger.
+
+        The trigger is only restarted if the timer entity, duration, use of the
+        timer wheel or alignment changes.
+        """
+
+        self.validate_options(timer_entity, duration)
+        self.auto_restart = auto_restart
+
+        if (
+            timer_entity == self.timer_entity
+            and duration == self.duration
+            and use_timer_wheel == self.use_timer_wheel
+            and align_to_clock == self.align_to_clock
+        ):
+            return
+
+        self.async_remove_from_hass()
+
+        self.timer_entity = timer_entity
+        self.duration = duration
+        self.use_timer_wheel = use_timer_wheel
+        self.align_to_clock = align_to_clock
+        self.error = TimerTriggerErrorEnum.NONE
+
+        if self.entity.hass.is_running:
+            await self.async_start()
 
     # ------------------------------------------------------------------
     async def async_validate_timer(self) -> bool:
@@ -99,27 +322,15 @@ class TimerTrigger:
 
     # ------------------------------------------------------------------
     async def async_restart_timer(self) -> bool:
-        """Restart timer."""
+        """Restart timer, in the background."""
 
         if self.error:
             return False
 
-        state: State = self.entity.hass.states.get(self.timer_entity)
-
-        if (
-            state.state == "idle"
-            and not TimerTrigger.restarting_timer
-            and self.auto_restart
-        ):
-            TimerTrigger.restarting_timer = True
-
-            await self.entity.hass.services.async_call(
-                "timer",
-                "start",
-                service_data={ATTR_ENTITY_ID: self.timer_entity},
-                blocking=True,
+        if self.auto_restart:
+            TimerFinishedDispatcher.async_get(self.entity.hass).async_request_restart(
+                self.timer_entity
             )
-            TimerTrigger.restarting_timer = False
         return True
 
     # ------------------------------------------------------------------
@@ -129,16 +340,20 @@ class TimerTrigger:
         if self.error:
             return
 
-        if self.unsub_async_track_point_in_utc_time:
+        if self.unsub_async_track_point_in_utc_time and not self.use_timer_wheel:
             self.unsub_async_track_point_in_utc_time()
             self.unsub_async_track_point_in_utc_time = None
 
+        if self.align_to_clock and not self.use_timer_wheel:
+            self.point_in_time_listener_start()
+
         if inspect.iscoroutinefunction(self.callback_trigger):
             await self.callback_trigger(self.error)
         else:
             self.callback_trigger(self.error)
 
-        self.point_in_time_listener_start()
+        if not self.align_to_clock and not self.use_timer_wheel:
+            self.point_in_time_listener_start()
 
     # ------------------------------------------------------------------
     def point_in_time_listener_start(self) -> None:
@@ -149,47 +364,65 @@ class TimerTrigger:
         self.unsub_async_track_point_in_utc_time = async_track_point_in_utc_time(
             self.entity.hass,
             self.async_point_in_time_listener,
-            dt_util.utcnow() + self.duration,
+            self.next_fire_time(),
         )
 
     # ------------------------------------------------------------------
-    @callback
-    async def async_handle_timer_finished(self, event: Event) -> None:
-        """Handle timer finished."""
+    def next_fire_time(self) -> datetime:
+        """Next fire time of the duration."""
+
+        if self.align_to_clock:
+            return next_aligned_time(dt_util.utcnow(), self.duration)
+
+        return dt_util.utcnow() + self.duration
+
+    # ------------------------------------------------------------------
+    async def async_handle_timer_finished(self, _event: Event) -> None:
+        """Handle timer finished, only called for the timer entity.
+
+        The restart is requested first, so the requests of all triggers on the
+        timer are served by one restart.
+        """
+
+        if not self.error and self.auto_restart:
+            if not await self.async_validate_timer():
+                return
+
+            await self.async_restart_timer()
 
         if inspect.iscoroutinefunction(self.callback_trigger):
             await self.callback_trigger(self.error)
         else:
             self.callback_trigger(self.error)
 
-        if not self.error and event.data[ATTR_ENTITY_ID] == self.timer_entity:
-            if self.auto_restart:
-                if await self.async_validate_timer():
-                    await self.async_restart_timer()
-
     # ------------------------------------------------------
     async def async_hass_started(self, _event: Event) -> None:
         """Hass started."""
 
+        await self.async_start()
+
+    # ------------------------------------------------------
+    async def async_start(self) -> None:
+        """Start listening to the timer entity or the duration."""
+
         if self.timer_entity != "":
             if await self.async_validate_timer():
-                self.entity.async_on_remove(
-                    self.entity.hass.bus.async_listen(
-                        "timer.finished", self.async_handle_timer_finished
-                    )
+                self.unsub_timer_finished = TimerFinishedDispatcher.async_get(
+                    self.entity.hass
+                ).async_add_listener(
+                    self.timer_entity, self.async_handle_timer_finished
                 )
 
                 if self.auto_restart:
                     await self.async_restart_timer()
 
-        else:
-            self.entity.async_on_remove(self.async_remove_from_hass)
+        elif self.use_timer_wheel:
+            self.unsub_async_track_point_in_utc_time = TimerWheel.async_get(
+                self.entity.hass
+            ).async_subscribe(self.duration, self.async_point_in_time_listener)
 
-            self.unsub_async_track_point_in_utc_time = async_track_point_in_utc_time(
-                self.entity.hass,
-                self.async_point_in_time_listener,
-                dt_util.utcnow() + self.duration,
-            )
+        else:
+            self.point_in_time_listener_start()
 
     # ------------------------------------------------------
     @callback
@@ -198,3 +431,7 @@ class TimerTrigger:
         if self.unsub_async_track_point_in_utc_time:
             self.unsub_async_track_point_in_utc_time()
             self.unsub_async_track_point_in_utc_time = None
+
+        if self.unsub_timer_finished:
+            self.unsub_timer_finished()
+            self.unsub_timer_finished = None
@@ -0,0 +1,234 @@
+"""Timer wheel.
+
+External imports: None
+"""
+
+from collections.abc import Callable, Coroutine
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+DATA_TIMER_WHEEL = __name__ + ".timer_wheel"
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_util.UTC)
+
+TimerWheelAction = Callable[[datetime], Coroutine[Any, Any, None] | None]
+
+
+# ------------------------------------------------------
+def next_aligned_time(now: datetime, period: timedelta) -> datetime:
+    """First whole multiple of period from the epoch after now.
+
+    E.g. the next whole minute for a period of one minute.
+    """
+
+    return EPOCH + period * ((now - EPOCH) // period + 1)
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class TimerWheelSubscriber:
+    """Timer wheel subscriber, fired every multiple ticks of its slot."""
+
+    def __init__(self, period_ms: int, action: TimerWheelAction) -> None:
+        """Init."""
+
+        self.period_ms: int = period_ms
+        self.job: HassJob = HassJob(action)
+        self.multiple: int = 1
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class TimerWheelSlot:
+    """Timer wheel slot.
+
+    One loop timer with the slot period, fanning out to the subscribers whose
+    period is a multiple of it. Ticks are whole multiples of the period from
+    the epoch, so a slow tick does not delay the following ones, and ticks
+    missed while the event loop was blocked are coalesced into one.
+    """
+
+    def __init__(self, wheel: "TimerWheel", period_ms: int) -> None:
+        """Init."""
+
+        self.wheel: TimerWheel = wheel
+        self.period_ms: int = period_ms
+        self.subscribers: list[TimerWheelSubscriber] = []
+        self.last_tick: int | None = None
+        self.next_time: datetime | None = None
+        self.unsub_timer: CALLBACK_TYPE | None = None
+
+    # ------------------------------------------------------------------
+    @property
+    def period(self) -> timedelta:
+        """Slot period."""
+        return timedelta(milliseconds=self.period_ms)
+
+    # ------------------------------------------------------------------
+    def add(self, subscriber: TimerWheelSubscriber) -> None:
+        """Add subscriber, first fired at the next whole multiple of its period."""
+
+        subscriber.multiple = subscriber.period_ms // self.period_ms
+        self.subscribers.append(subscriber)
+
+        if self.unsub_timer is None:
+            self.schedule()
+
+    # ------------------------------------------------------------------
+    def schedule(self) -> None:
+        """Schedule the next tick."""
+
+        self.next_time = next_aligned_time(dt_util.utcnow(), self.period)
+        self.unsub_timer = async_track_point_in_utc_time(
+            self.wheel.hass, self.async_tick, self.next_time
+        )
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_tick(self, now: datetime) -> None:
+        """Fire the subscribers due since the last tick, once each."""
+
+        tick: int = (max(dt_util.utcnow(), self.next_time) - EPOCH) // self.period
+        last_tick: int = tick - 1 if self.last_tick is None else self.last_tick
+        self.last_tick = tick
+        self.wheel.wakeups += 1
+
+        for subscriber in list(self.subscribers):
+            if tick // subscriber.multiple > last_tick // subscriber.multiple:
+                self.wheel.rotations += 1
+                self.wheel.hass.async_run_hass_job(subscriber.job, now)
+
+        if len(self.subscribers) > 0:
+            self.schedule()
+        else:
+            self.unsub_timer = None
+
+    # ------------------------------------------------------------------
+    def cancel(self) -> None:
+        """Cancel the loop timer."""
+
+        if self.unsub_timer is not None:
+            self.unsub_timer()
+            self.unsub_timer = None
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class TimerWheel:
+    """Timer wheel class.
+
+    Domain wide scheduler for periodic triggers. Subscribers with the same or
+    harmonically related periods share a slot, so a slot wakes the event loop
+    once per tick for all of them, instead of one loop timer per subscriber.
+    A period joins the slot with a period dividing it. A new period dividing
+    existing slot periods becomes the slot for them.
+
+    External imports: None
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.slots: dict[int, TimerWheelSlot] = {}
+
+        self.started: float = hass.loop.time()
+        self.wakeups: int = 0
+        self.rotations: int = 0
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    @callback
+    def async_get(hass: HomeAssistant) -> "TimerWheel":
+        """Get the timer wheel, create it if needed."""
+
+        if (wheel := hass.data.get(DATA_TIMER_WHEEL)) is None:
+            wheel = hass.data[DATA_TIMER_WHEEL] = TimerWheel(hass)
+
+        return wheel
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_subscribe(
+        self, period: timedelta, action: TimerWheelAction
+    ) -> CALLBACK_TYPE:
+        """Call action every period. Returns the unsubscribe callback."""
+
+        period_ms: int = round(period.total_seconds() * 1000)
+
+        if period_ms <= 0:
+            raise ValueError("period must be positive")
+
+        subscriber: TimerWheelSubscriber = TimerWheelSubscriber(period_ms, action)
+        self.slot_for(period_ms).add(subscriber)
+
+        @callback
+        def async_unsubscribe() -> None:
+            self.remove(subscriber)
+
+        return async_unsubscribe
+
+    # ------------------------------------------------------------------
+    def slot_for(self, period_ms: int) -> TimerWheelSlot:
+        """Slot for period, merging slots the period divides."""
+
+        for slot_period_ms in sorted(self.slots):
+            if period_ms % slot_period_ms == 0:
+                return self.slots[slot_period_ms]
+
+        slot: TimerWheelSlot = TimerWheelSlot(self, period_ms)
+
+        for slot_period_ms in [
+            slot_period_ms
+            for slot_period_ms in self.slots
+            if slot_period_ms % period_ms == 0
+        ]:
+            old_slot: TimerWheelSlot = self.slots.pop(slot_period_ms)
+            old_slot.cancel()
+
+            for subscriber in old_slot.subscribers:
+                slot.add(subscriber)
+
+        self.slots[period_ms] = slot
+        return slot
+
+    # ------------------------------------------------------------------
+    def remove(self, subscriber: TimerWheelSubscriber) -> None:
+        """Remove subscriber, and its slot when empty.
+
+        A slot left without a subscriber of its own period is split again, so
+        the remaining subscribers do not keep waking at the shorter period.
+        """
+
+        for period_ms, slot in list(self.slots.items()):
+            if subscriber in slot.subscribers:
+                slot.subscribers.remove(subscriber)
+
+                if all(item.multiple > 1 for item in slot.subscribers):
+                    slot.cancel()
+                    del self.slots[period_ms]
+
+                    for item in slot.subscribers:
+                        self.slot_for(item.period_ms).add(item)
+                return
+
+    # ------------------------------------------------------------------
+    def as_dict(self) -> dict[str, Any]:
+        """Diagnostics."""
+
+        minutes: float = max((self.hass.loop.time() - self.started) / 60, 1 / 60)
+
+        return {
+            "slots": {
+                str(slot.period): len(slot.subscribers) for slot in self.slots.values()
+            },
+            "wakeups": self.wakeups,
+            "rotations": self.rotations,
+            "wakeups_per_minute": round(self.wakeups / minutes, 2),
+            "rotations_per_wakeup": round(self.rotations / self.wakeups, 2)
+            if self.wakeups > 0
+            else 0,
+        }
@@ -0,0 +1,195 @@
+"""Icon cache."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+    ConfigEntryState,
+)
+from homeassistant.const import EVENT_COMPONENT_LOADED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er, icon as ic
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+ICON_CACHE_MAX_SIZE = 1024
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class IconCache:
+    """Icon cache class.
+
+    LRU bounded cache of resolved icons, keyed by entity id and by
+    (platform, domain, translation key). Entries are invalidated when the entity
+    registry entry is updated, the integration is loaded again, or a config
+    entry of the integration is loaded, unloaded or removed.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, max_size: int = ICON_CACHE_MAX_SIZE
+    ) -> None:
+        """Icon cache."""
+        self.hass: HomeAssistant = hass
+        self.max_size: int = max_size
+
+        self.entity_icons: OrderedDict[str, str | None] = OrderedDict()
+        self.translation_icons: OrderedDict[tuple[str, str, str | None], str | None] = (
+            OrderedDict()
+        )
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self.unsubs: list[CALLBACK_TYPE] = [
+            hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self.async_entity_registry_updated
+            ),
+            hass.bus.async_listen(EVENT_COMPONENT_LOADED, self.async_component_loaded),
+            async_dispatcher_connect(
+                hass, SIGNAL_CONFIG_ENTRY_CHANGED, self.async_config_entry_changed
+            ),
+        ]
+
+    # ------------------------------------------------------
+    async def async_get_icon(self, entity_id: str) -> str | None:
+        """Get icon for entity from the entity registry or icon translations."""
+
+        if entity_id in self.entity_icons:
+            self.hits += 1
+            self.entity_icons.move_to_end(entity_id)
+            return self.entity_icons[entity_id]
+
+        self.misses += 1
+        tmp_icon: str | None = None
+
+        entity_registry = er.async_get(self.hass)
+        source_entity = entity_registry.async_get(entity_id)
+
+        if source_entity is not None:
+            if source_entity.icon is not None:
+                tmp_icon = source_entity.icon
+            else:
+                tmp_icon = await self.async_get_translation_icon(
+                    source_entity.platform,
+                    source_entity.domain,
+                    source_entity.translation_key,
+                )
+
+        self._store(self.entity_icons, entity_id, tmp_icon)
+        return tmp_icon
+
+    # ------------------------------------------------------
+    async def async_get_translation_icon(
+        self, platform: str, domain: str, translation_key: str | None
+    ) -> str | None:
+        """Get default icon from the icon translations of the integration."""
+
+        key = (platform, domain, translation_key)
+
+        if key in self.translation_icons:
+            self.hits += 1
+            self.translation_icons.move_to_end(key)
+            return self.translation_icons[key]
+
+        self.misses += 1
+        tmp_icon: str | None = None
+
+        if translation_key is not None:
+            icons = await ic.async_get_icons(
+                self.hass,
+                "entity",
+                integrations=[platform],
+            )
+
+            if (
+                icons is not None
+                and platform in icons
+                and domain in icons[platform]
+                and translation_key in icons[platform][domain]
+                and "default" in icons[platform][domain][translation_key]
+            ):
+                tmp_icon = icons[platform][domain][translation_key]["default"]
+
+        self._store(self.translation_icons, key, tmp_icon)
+        return tmp_icon
+
+    # ------------------------------------------------------
+    def _store(self, cache: OrderedDict, key, icon: str | None) -> None:
+        """Store icon in cache and evict the least recently used."""
+
+        cache[key] = icon
+        cache.move_to_end(key)
+
+        while len(cache) > self.max_size:
+            cache.popitem(last=False)
+
+    # ------------------------------------------------------
+    @callback
+    def async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Invalidate entity when the entity registry entry is updated."""
+
+        self.entity_icons.pop(event.data["entity_id"], None)
+
+        if "old_entity_id" in event.data:
+            self.entity_icons.pop(event.data["old_entity_id"], None)
+
+    # ------------------------------------------------------
+    @callback
+    def async_component_loaded(self, event: Event) -> None:
+        """Invalidate icons of an integration when it is loaded again."""
+
+        self.invalidate_integration(event.data.get("component", ""))
+
+    # ------------------------------------------------------
+    @callback
+    def async_config_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Invalidate icons of an integration when a config entry is reloaded."""
+
+        if change is ConfigEntryChange.REMOVED or entry.state in (
+            ConfigEntryState.LOADED,
+            ConfigEntryState.NOT_LOADED,
+        ):
+            self.invalidate_integration(entry.domain)
+
+    # ------------------------------------------------------
+    def invalidate_integration(self, integration: str) -> None:
+        """Invalidate the icons of an integration and of all entities."""
+
+        keys = [key for key in self.translation_icons if key[0] == integration]
+
+        if len(keys) == 0:
+            return
+
+        for key in keys:
+            del self.translation_icons[key]
+
+        self.entity_icons.clear()
+
+    # ------------------------------------------------------
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening for invalidations."""
+
+        for unsub in self.unsubs:
+            unsub()
+
+        self.unsubs.clear()
+
+    # ------------------------------------------------------
+    def as_dict(self) -> dict:
+        """Cache statistics."""
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entity_icons": len(self.entity_icons),
+            "translation_icons": len(self.translation_icons),
+        }
@@ -0,0 +1,145 @@
+"""Issue tracker."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import partial
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+ISSUE_MIN_INTERVAL = 60
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class IssueTracker:
+    """Issue tracker class.
+
+    Keeps at most one repair issue per translation key and carousel, with a
+    stable issue id. An issue is only written again if its placeholders change,
+    and at most once per min interval, the latest change is written at the end
+    of the interval. Issues are deleted when their condition clears.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        id_prefix: str,
+        min_interval: float = ISSUE_MIN_INTERVAL,
+    ) -> None:
+        """Issue tracker."""
+        self.hass: HomeAssistant = hass
+        self.id_prefix: str = id_prefix
+        self.min_interval: float = min_interval
+
+        self.issues: dict[str, dict[str, str]] = {}
+        self.last_created: dict[str, float] = {}
+        self.pending: dict[str, dict[str, str]] = {}
+        self.cancel_pending: dict[str, CALLBACK_TYPE] = {}
+
+    # ------------------------------------------------------
+    def issue_id(self, translation_key: str) -> str:
+        """Issue id for translation key."""
+        return f"{self.id_prefix}_{translation_key}"
+
+    # ------------------------------------------------------
+    @callback
+    def async_create(
+        self, translation_key: str, translation_placeholders: dict[str, str]
+    ) -> None:
+        """Create or update issue."""
+
+        issue_id: str = self.issue_id(translation_key)
+
+        if self.pending.get(issue_id, self.issues.get(issue_id)) == (
+            translation_placeholders
+        ):
+            return
+
+        elapsed: float = self.hass.loop.time() - self.last_created.get(
+            issue_id, -self.min_interval
+        )
+
+        if elapsed >= self.min_interval:
+            self._create(translation_key, translation_placeholders)
+            return
+
+        self.pending[issue_id] = translation_placeholders
+
+        if issue_id not in self.cancel_pending:
+            self.cancel_pending[issue_id] = async_call_later(
+                self.hass,
+                self.min_interval - elapsed,
+                partial(self._async_create_pending, translation_key),
+            )
+
+    # ------------------------------------------------------
+    @callback
+    def async_delete(self, translation_key: str) -> None:
+        """Delete issue, its condition has cleared."""
+
+        issue_id: str = self.issue_id(translation_key)
+        self._cancel_pending(issue_id)
+
+        if self.issues.pop(issue_id, None) is not None:
+            ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+
+    # ------------------------------------------------------
+    @callback
+    def async_delete_all(self) -> None:
+        """Delete all issues."""
+
+        for issue_id in list(self.cancel_pending):
+            self._cancel_pending(issue_id)
+
+        for issue_id in self.issues:
+            ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+
+        self.issues.clear()
+
+    # ------------------------------------------------------
+    @callback
+    def _async_create_pending(self, translation_key: str, _now: datetime) -> None:
+        """Create issue postponed by the min interval."""
+
+        issue_id: str = self.issue_id(translation_key)
+        self.cancel_pending.pop(issue_id, None)
+
+        if (translation_placeholders := self.pending.pop(issue_id, None)) is not None:
+            self._create(translation_key, translation_placeholders)
+
+    # ------------------------------------------------------
+    def _create(
+        self, translation_key: str, translation_placeholders: dict[str, str]
+    ) -> None:
+        """Create issue in the issue registry."""
+
+        issue_id: str = self.issue_id(translation_key)
+        self._cancel_pending(issue_id)
+
+        self.issues[issue_id] = translation_placeholders
+        self.last_created[issue_id] = self.hass.loop.time()
+
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            issue_id,
+            issue_domain=DOMAIN,
+            is_fixable=False,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key=translation_key,
+            translation_placeholders=translation_placeholders,
+        )
+
+    # ------------------------------------------------------
+    def _cancel_pending(self, issue_id: str) -> None:
+        """Cancel postponed issue."""
+
+        self.pending.pop(issue_id, None)
+
+        if (cancel := self.cancel_pending.pop(issue_id, None)) is not None:
+            cancel()
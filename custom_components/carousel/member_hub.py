@@ -0,0 +1,231 @@
+"""Member hub shared by all carousels."""
+
+from __future__ import annotations
+
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
+    ATTR_UNIT_OF_MEASUREMENT,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import get_device_class
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_state_change_event,
+)
+
+from .const import DATA_MEMBER_HUB
+from .icon_cache import IconCache
+
+INFO_ATTRIBUTES: tuple[str, ...] = (
+    ATTR_DEVICE_CLASS,
+    ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
+    ATTR_UNIT_OF_MEASUREMENT,
+)
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class MemberInfo:
+    """Member info class.
+
+    State and derived info for an entity watched by one or more carousels.
+    Slotted, as there is one per watched entity.
+    """
+
+    __slots__ = (
+        "cancel_listener",
+        "device_class",
+        "entity_id",
+        "friendly_name",
+        "icon",
+        "info_valid",
+        "listeners",
+        "state",
+        "unit_of_measurement",
+    )
+
+    def __init__(self, entity_id: str, state: State | None = None) -> None:
+        """Member info."""
+        self.entity_id: str = entity_id
+        self.state: State | None = state
+        self.friendly_name: str | None = None
+        self.icon: str | None = None
+        self.unit_of_measurement: str | None = None
+        self.device_class: str | None = None
+        self.info_valid: bool = False
+
+        self.listeners: list[HassJob] = []
+        self.cancel_listener: CALLBACK_TYPE | None = None
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class MemberHub:
+    """Member hub class.
+
+    Keeps one state subscription and one member info per watched entity,
+    reference counted across all carousels.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Member hub."""
+        self.hass: HomeAssistant = hass
+        self.members: dict[str, MemberInfo] = {}
+        self.icon_cache: IconCache = IconCache(hass)
+
+        self.unsub_registry_updated: CALLBACK_TYPE = hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self.async_entity_registry_updated
+        )
+
+    # ------------------------------------------------------
+    @staticmethod
+    @callback
+    def async_get(hass: HomeAssistant) -> MemberHub:
+        """Get the member hub, create it if needed."""
+
+        if (hub := hass.data.get(DATA_MEMBER_HUB)) is None:
+            hub = hass.data[DATA_MEMBER_HUB] = MemberHub(hass)
+
+        return hub
+
+    # ------------------------------------------------------
+    @staticmethod
+    @callback
+    def async_shutdown(hass: HomeAssistant) -> None:
+        """Remove the member hub and its listeners, if created."""
+
+        if (hub := hass.data.pop(DATA_MEMBER_HUB, None)) is None:
+            return
+
+        for member in hub.members.values():
+            member.cancel_listener()
+
+        hub.members.clear()
+        hub.unsub_registry_updated()
+        hub.icon_cache.async_shutdown()
+
+    # ------------------------------------------------------
+    @callback
+    def async_add_listener(self, entity_id: str, job: HassJob) -> None:
+        """Add listener for state changes of entity."""
+
+        if (member := self.members.get(entity_id)) is None:
+            member = self.members[entity_id] = MemberInfo(
+                entity_id, self.hass.states.get(entity_id)
+            )
+            member.cancel_listener = async_track_state_change_event(
+                self.hass, entity_id, self.async_state_listener
+            )
+
+        member.listeners.append(job)
+
+    # ------------------------------------------------------
+    @callback
+    def async_remove_listener(self, entity_id: str, job: HassJob) -> None:
+        """Remove listener for state changes of entity."""
+
+        if (member := self.members.get(entity_id)) is None:
+            return
+
+        if job in member.listeners:
+            member.listeners.remove(job)
+
+        if len(member.listeners) == 0:
+            member.cancel_listener()
+            del self.members[entity_id]
+
+    # ------------------------------------------------------
+    @callback
+    def async_state_listener(self, event: Event[EventStateChangedData]) -> None:
+        """Handle state changes on a watched entity."""
+
+        if (member := self.members.get(event.data[ATTR_ENTITY_ID])) is None:
+            return
+
+        old_state: State | None = event.data["old_state"]
+        member.state = event.data["new_state"]
+
+        if (
+            old_state is None
+            or member.state is None
+            or any(
+                old_state.attributes.get(attr) != member.state.attributes.get(attr)
+                for attr in INFO_ATTRIBUTES
+            )
+        ):
+            member.info_valid = False
+
+        for job in list(member.listeners):
+            self.hass.async_run_hass_job(job, event)
+
+    # ------------------------------------------------------
+    @callback
+    def async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Invalidate member info when the entity registry entry is updated."""
+
+        if (member := self.members.get(event.data["entity_id"])) is not None:
+            member.info_valid = False
+
+    # ------------------------------------------------------
+    def get_member(self, entity_id: str) -> MemberInfo:
+        """Get member info of entity.
+
+        A member info not kept by the hub is returned for entities not watched.
+        """
+
+        if (member := self.members.get(entity_id)) is not None:
+            return member
+
+        return MemberInfo(entity_id, self.hass.states.get(entity_id))
+
+    # ------------------------------------------------------
+    async def async_get_member_info(self, entity_id: str) -> MemberInfo:
+        """Get member info, resolve derived info if needed.
+
+        The derived info is only resolved again when one of the info attributes
+        or the entity registry entry of the member changes.
+        """
+
+        member: MemberInfo = self.get_member(entity_id)
+
+        if member.info_valid or member.state is None:
+            return member
+
+        member.friendly_name = member.state.attributes.get(ATTR_FRIENDLY_NAME, None)
+        member.device_class = get_device_class(self.hass, entity_id)
+        member.unit_of_measurement = member.state.attributes.get(
+            ATTR_UNIT_OF_MEASUREMENT, None
+        )
+
+        if member.device_class is None:
+            member.icon = await self.async_get_icon(member.state)
+        else:
+            member.icon = None
+
+        member.info_valid = True
+        return member
+
+    # ------------------------------------------------------
+    async def async_get_icon(self, state: State) -> str | None:
+        """Get icon."""
+
+        tmp_icon = state.attributes.get(ATTR_ICON, None)
+
+        if tmp_icon is not None:
+            return tmp_icon
+
+        return await self.icon_cache.async_get_icon(state.entity_id)
@@ -17,6 +17,7 @@ from homeassistant.util import dt as dt_util
 from .base_carousel_entity import BaseCarouselEntity
 from .base_entity_info import BaseEntityInfo
 from .const import CONF_ENTITY_IDS, TRANSLATION_KEY
+from .entity_info_list import EntityInfoList
 
 
 # ------------------------------------------------------
@@ -39,24 +40,7 @@ async def async_setup_entry(
 class SensorEntityInfo(BaseEntityInfo):
     """Sensor Entity info class."""
 
-    def __init__(
-        self,
-        entity_id: str,
-        friendly_name: str | None = None,
-        icon: str | None = None,
-        unit_of_measurement: str | None = None,
-        device_class: SensorDeviceClass | None = None,
-    ) -> None:
-        """Sensor entity info."""
-        super().__init__(
-            entity_id,
-            friendly_name,
-            icon,
-            unit_of_measurement,
-        )
-
-        self.device_class: SensorDeviceClass | None = device_class
-        self.entity_obj: SensorEntity
+    __slots__ = ()
 
 
 # ------------------------------------------------------
@@ -64,6 +48,8 @@ class SensorEntityInfo(BaseEntityInfo):
 class CarouselSensor(SensorEntity, BaseCarouselEntity):
     """Sensor class for carousel."""
 
+    entity_info_class = SensorEntityInfo
+
     # ------------------------------------------------------
     def __init__(
         self,
@@ -77,9 +63,9 @@ class CarouselSensor(SensorEntity, BaseCarouselEntity):
             entry,
         )
 
-        self.entities_list: list[SensorEntityInfo] = [
+        self.entities_list: EntityInfoList[SensorEntityInfo] = EntityInfoList(
             SensorEntityInfo(entity) for entity in entities
-        ]
+        )
 
         self.translation_key = TRANSLATION_KEY
 
@@ -93,7 +79,7 @@ class CarouselSensor(SensorEntity, BaseCarouselEntity):
 
         """
 
-        if self.current_entity is not None:
+        if self.current_entity is not None and self.current_entity.state is not None:
             if self.current_entity.device_class == SensorDeviceClass.TIMESTAMP:
                 return dt_util.parse_datetime(self.current_entity.state.state)
 
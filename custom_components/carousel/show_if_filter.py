@@ -0,0 +1,177 @@
+"""Show if filter.
+
+Structured alternative to the show if template for simple conditions. The
+filter is compiled once to plain Python predicates on the member state.
+
+Example:
+    any:
+      - operator: ">"
+        value: 20
+      - attribute: battery_level
+        operator: "<="
+        value: 10
+      - all:
+          - operator: "not in"
+            value: [unavailable, unknown]
+          - attribute: device_class
+            value: temperature
+
+A condition compares the state, or the attribute if given, with the value using
+the operator. The operator defaults to "==". A number value compares numbers,
+text and boolean values compare text. A list at the top level is the same as
+"all".
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import operator
+from typing import Any
+
+from homeassistant.core import State
+
+ShowIfPredicate = Callable[[State], bool]
+
+CONF_ALL = "all"
+CONF_ANY = "any"
+CONF_ATTRIBUTE = "attribute"
+CONF_OPERATOR = "operator"
+CONF_VALUE = "value"
+
+COMPARE_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+IN_OPERATORS: tuple[str, ...] = ("in", "not in")
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class ShowIfFilterError(ValueError):
+    """Invalid show if filter."""
+
+
+# ------------------------------------------------------
+def compile_show_if_filter(config: Any) -> ShowIfPredicate:
+    """Compile show if filter config to a predicate on the member state."""
+
+    if isinstance(config, list):
+        return _compile_group(CONF_ALL, config)
+
+    if not isinstance(config, dict) or len(config) == 0:
+        raise ShowIfFilterError("Filter must be a condition, a group or a list")
+
+    if CONF_ALL in config or CONF_ANY in config:
+        if len(config) != 1:
+            raise ShowIfFilterError("A group must only contain 'all' or 'any'")
+
+        group_type, conditions = next(iter(config.items()))
+        return _compile_group(group_type, conditions)
+
+    return _compile_condition(config)
+
+
+# ------------------------------------------------------
+def _compile_group(group_type: str, conditions: Any) -> ShowIfPredicate:
+    """Compile all/any group."""
+
+    if not isinstance(conditions, list) or len(conditions) == 0:
+        raise ShowIfFilterError(f"'{group_type}' must be a non empty list")
+
+    predicates: tuple[ShowIfPredicate, ...] = tuple(
+        compile_show_if_filter(condition) for condition in conditions
+    )
+
+    if len(predicates) == 1:
+        return predicates[0]
+
+    if group_type == CONF_ALL:
+        return lambda state: all(predicate(state) for predicate in predicates)
+
+    return lambda state: any(predicate(state) for predicate in predicates)
+
+
+# ------------------------------------------------------
+def _compile_condition(config: dict[str, Any]) -> ShowIfPredicate:
+    """Compile condition."""
+
+    if unknown := set(config) - {CONF_ATTRIBUTE, CONF_OPERATOR, CONF_VALUE}:
+        raise ShowIfFilterError(f"Unknown keys: {', '.join(sorted(unknown))}")
+
+    if CONF_VALUE not in config:
+        raise ShowIfFilterError("A condition must have a value")
+
+    attribute: str | None = config.get(CONF_ATTRIBUTE)
+    op: str = config.get(CONF_OPERATOR, "==")
+    value: Any = config[CONF_VALUE]
+
+    if attribute is None:
+
+        def get_value(state: State) -> Any:
+            return state.state
+
+    else:
+
+        def get_value(state: State) -> Any:
+            return state.attributes.get(attribute)
+
+    if op in IN_OPERATORS:
+        if not isinstance(value, list):
+            raise ShowIfFilterError(f"Value for '{op}' must be a list")
+
+        values: frozenset[str] = frozenset(_as_str(item) for item in value)
+
+        if op == "in":
+            return lambda state: _as_str(get_value(state)) in values
+
+        return lambda state: _as_str(get_value(state)) not in values
+
+    if (compare := COMPARE_OPERATORS.get(op)) is None:
+        raise ShowIfFilterError(f"Unknown operator: {op}")
+
+    if not isinstance(value, (str, int, float)):
+        raise ShowIfFilterError(f"Value for '{op}' must be a number, text or boolean")
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        number: float = float(value)
+
+        def predicate(state: State) -> bool:
+            if (actual := _as_float(get_value(state))) is None:
+                return op == "!="
+
+            return compare(actual, number)
+
+        return predicate
+
+    text: str = _as_str(value)
+    return lambda state: compare(_as_str(get_value(state)), text)
+
+
+# ------------------------------------------------------
+def _as_float(value: Any) -> float | None:
+    """Value as float, None if not a number."""
+
+    if value is None or isinstance(value, bool):
+        return None
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# ------------------------------------------------------
+def _as_str(value: Any) -> str:
+    """Value as text, booleans as the state text of on/off."""
+
+    if isinstance(value, bool):
+        return "on" if value else "off"
+
+    if value is None:
+        return ""
+
+    return str(value)
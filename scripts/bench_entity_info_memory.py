@@ -0,0 +1,144 @@
+"""Benchmark memory per carousel member, before and after slotting entity infos.
+
+Compares 10k members held as the former plain entity info, copying the member
+info and holding the state, with the slotted entity info reading the member
+info shared by all carousels. The states themselves belong to the state
+machine and are created before measuring.
+
+Run from the repository root, with Home Assistant installed:
+
+    python scripts/bench_entity_info_memory.py
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import gc
+from pathlib import Path
+import sys
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import State  # noqa: E402
+
+from custom_components.carousel.member_hub import MemberInfo  # noqa: E402
+from custom_components.carousel.sensor import SensorEntityInfo  # noqa: E402
+
+MEMBERS = 10_000
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class FormerEntityInfo:
+    """Entity info as before slotting, a plain object with copied member info."""
+
+    def __init__(
+        self,
+        entity_id: str,
+        friendly_name: str | None = None,
+        icon: str | None = None,
+        unit_of_measurement: str | None = None,
+        show_x_times: int | None = None,
+        remove_at_timedelta: timedelta | None = None,
+    ) -> None:
+        """Init."""
+        self.entity_id: str = entity_id
+        self.friendly_name: str | None = friendly_name
+        self.icon: str | None = icon
+        self.unit_of_measurement: str | None = unit_of_measurement
+        self.state: State = None
+        self.show_x_times: int = show_x_times
+        self.remove_at: datetime = None
+        self.is_visible: bool = True
+        self.device_class: str | None = None
+
+
+# ------------------------------------------------------
+def states() -> list[State]:
+    """States of the members, owned by the state machine."""
+
+    return [
+        State(
+            f"sensor.member_{i}",
+            str(i),
+            {"friendly_name": f"Member {i}", "unit_of_measurement": "W"},
+        )
+        for i in range(MEMBERS)
+    ]
+
+
+# ------------------------------------------------------
+def former(member_states: list[State]) -> list[FormerEntityInfo]:
+    """Members as former entity infos."""
+
+    infos: list[FormerEntityInfo] = []
+
+    for state in member_states:
+        info = FormerEntityInfo(
+            str(state.entity_id),
+            str(state.attributes["friendly_name"]),
+            None,
+            str(state.attributes["unit_of_measurement"]),
+        )
+        info.state = state
+        info.device_class = None
+        infos.append(info)
+
+    return infos
+
+
+# ------------------------------------------------------
+def slotted(member_states: list[State]) -> list[tuple[SensorEntityInfo, MemberInfo]]:
+    """Members as slotted entity infos, with the shared member info."""
+
+    infos: list[tuple[SensorEntityInfo, MemberInfo]] = []
+
+    for state in member_states:
+        member = MemberInfo(state.entity_id, state)
+        member.friendly_name = str(state.attributes["friendly_name"])
+        member.unit_of_measurement = str(state.attributes["unit_of_measurement"])
+
+        info = SensorEntityInfo(str(state.entity_id))
+        info.member = member
+        infos.append((info, member))
+
+    return infos
+
+
+# ------------------------------------------------------
+def measure(build, member_states: list[State]) -> float:
+    """Bytes allocated per member by build."""
+
+    gc.collect()
+    tracemalloc.start()
+    result = build(member_states)
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size / MEMBERS
+
+
+# ------------------------------------------------------
+def main() -> None:
+    """Run benchmark."""
+
+    member_states: list[State] = states()
+
+    former_size: float = measure(former, member_states)
+    slotted_size: float = measure(slotted, member_states)
+    entity_info_size: float = measure(
+        lambda member_states: [
+            SensorEntityInfo(str(state.entity_id)) for state in member_states
+        ],
+        member_states,
+    )
+
+    print(f"{MEMBERS} members, bytes per member:")
+    print(f"  former entity info:                    {former_size:7.0f}")
+    print(f"  slotted entity info with member info:  {slotted_size:7.0f}")
+    print(f"  slotted entity info per extra carousel: {entity_info_size:6.0f}")
+
+
+if __name__ == "__main__":
+    main()
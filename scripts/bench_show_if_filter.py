@@ -0,0 +1,80 @@
+"""Benchmark the show if filter against the show if template.
+
+Evaluates 'state > 20' for 1k members, as a compiled show if filter and as
+the show if template '{{ state | float > 20 }}' rendered the way the carousel
+renders it.
+
+Run from the repository root, with Home Assistant installed:
+
+    python scripts/bench_show_if_filter.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import HomeAssistant, State  # noqa: E402
+from homeassistant.helpers.template import Template  # noqa: E402
+
+from custom_components.carousel.show_if_filter import (  # noqa: E402
+    compile_show_if_filter,
+)
+
+MEMBERS = 1_000
+ROUNDS = 20
+
+
+# ------------------------------------------------------
+async def main() -> None:
+    """Run benchmark."""
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+
+        states: list[State] = [
+            State(f"sensor.member_{i}", str(i % 40), {"unit_of_measurement": "C"})
+            for i in range(MEMBERS)
+        ]
+        predicate = compile_show_if_filter({"operator": ">", "value": 20})
+        template = Template("{{ state | float > 20 }}", hass)
+
+        def render(state: State) -> bool:
+            return str(
+                template.async_render_to_info(
+                    {"state": state.state, "state_attributes": state.attributes},
+                    parse_result=False,
+                ).result()
+            ) == str(True)
+
+        assert [predicate(state) for state in states] == [
+            render(state) for state in states
+        ]
+
+        start: float = time.perf_counter()
+        for _ in range(ROUNDS):
+            for state in states:
+                predicate(state)
+        predicate_ms: float = (time.perf_counter() - start) / ROUNDS * 1000
+
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            for state in states:
+                render(state)
+        template_ms: float = (time.perf_counter() - start) / ROUNDS * 1000
+
+        print(f"{MEMBERS} members, 'state > 20', ms per evaluation of all members:")
+        print(f"  show if filter:   {predicate_ms:7.2f}")
+        print(f"  show if template: {template_ms:7.2f}")
+        print(f"  speedup:          {template_ms / predicate_ms:7.0f}x")
+
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,113 @@
+"""Benchmark the storage codecs of StorageJson.
+
+Encodes and decodes carousel storage with 10k added members, through
+jsonpickle and through the schema codec, including the json the store writes
+and reads.
+
+Run from the repository root, with Home Assistant and jsonpickle installed:
+
+    python scripts/bench_storage_codec.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers.json import json_bytes  # noqa: E402
+from homeassistant.util.json import json_loads  # noqa: E402
+
+from custom_components.carousel.carousel_storage import CarouselStorage  # noqa: E402
+from custom_components.carousel.hass_util.storage_json import (  # noqa: E402
+    DICT_KEY_SCHEMA,
+)
+
+MEMBERS = 10_000
+ROUNDS = 10
+
+
+# ------------------------------------------------------
+class PickledCarouselStorage(CarouselStorage):
+    """Carousel storage through jsonpickle, as before the schema codec."""
+
+    schema_fields___ = ()
+
+
+# ------------------------------------------------------
+def fill(storage: CarouselStorage) -> None:
+    """Fill storage with the added members."""
+
+    storage.current_entity_id = "sensor.member_0"
+    storage.added_entities = [
+        {
+            "entity_id": f"sensor.member_{i}",
+            "show_x_times": i % 5 or None,
+            "remove_at": "2026-01-01T12:00:00+00:00" if i % 3 == 0 else None,
+        }
+        for i in range(MEMBERS)
+    ]
+    storage.removed_entity_ids = [f"sensor.removed_{i}" for i in range(100)]
+
+
+# ------------------------------------------------------
+def round_trip_pickled(storage: CarouselStorage) -> None:
+    """Encode, write json, read json and decode through jsonpickle."""
+
+    data: dict = json_loads(json_bytes(storage.data_to_save({})))
+    storage.__dict__.update(storage.decode_data(data[storage.DICT_KEY___]).__dict__)
+
+
+# ------------------------------------------------------
+def round_trip_schema(storage: CarouselStorage) -> None:
+    """Encode, write json, read json and decode through the schema codec."""
+
+    data: dict = json_loads(json_bytes(storage.data_to_save({})))
+    storage.decode_schema(data[DICT_KEY_SCHEMA])
+
+
+# ------------------------------------------------------
+def measure(round_trip, storage: CarouselStorage) -> float:
+    """Ms per round trip."""
+
+    round_trip(storage)
+    start: float = time.perf_counter()
+
+    for _ in range(ROUNDS):
+        round_trip(storage)
+
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+# ------------------------------------------------------
+async def main() -> None:
+    """Run benchmark."""
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+
+        pickled: CarouselStorage = PickledCarouselStorage(hass, "bench")
+        schema: CarouselStorage = CarouselStorage(hass, "bench")
+        fill(pickled)
+        fill(schema)
+
+        pickled_ms: float = measure(round_trip_pickled, pickled)
+        schema_ms: float = measure(round_trip_schema, schema)
+
+        assert pickled.added_entities == schema.added_entities
+
+        print(f"{MEMBERS} added members, ms per encode and decode:")
+        print(f"  jsonpickle:   {pickled_ms:7.2f}")
+        print(f"  schema codec: {schema_ms:7.2f}")
+        print(f"  speedup:      {pickled_ms / schema_ms:7.0f}x")
+
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,19 @@
+"""Fixtures for Carousel tests."""
+
+import pytest
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+# ------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations in all tests."""
+    return
+
+
+# ------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def tmp_config_dir(hass, tmp_path):
+    """Keep files written by the integration out of the test config."""
+    hass.config.config_dir = str(tmp_path)
@@ -0,0 +1,25 @@
+"""Test diagnostics."""
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.carousel.const import DATA_MEMBER_HUB, DOMAIN
+from custom_components.carousel.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+# ------------------------------------------------------------------
+async def test_unloaded_entry_creates_no_helpers(hass: HomeAssistant) -> None:
+    """Diagnostics of an unloaded entry do not create the shared helpers."""
+
+    entry = MockConfigEntry(domain=DOMAIN, title="Carousel", options={})
+    entry.add_to_hass(hass)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["carousel"] is None
+    assert diagnostics["member_hub"] is None
+    assert diagnostics["timer_wheel"] is None
+    assert diagnostics["timer_finished"] is None
+    assert DATA_MEMBER_HUB not in hass.data
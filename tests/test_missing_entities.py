@@ -0,0 +1,117 @@
+"""Test pruning of members without a state."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.carousel.const import (
+    DATA_CAROUSELS,
+    DOMAIN,
+    TRANSLATION_KEY_MISSING_ENTITY,
+)
+
+ENTITY_IDS = [f"sensor.member_{i}" for i in range(5)]
+
+
+# ------------------------------------------------------------------
+async def async_setup_carousel(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up a sensor carousel over the members."""
+
+    for i, entity_id in enumerate(ENTITY_IDS):
+        hass.states.async_set(entity_id, str(i * 10))
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Carousel",
+        options={
+            "name": "Carousel",
+            "platform_type": "sensor",
+            "entity_ids": ENTITY_IDS,
+            "rotate_every_minutes": 1,
+            "restart_timer": False,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    return entry
+
+
+# ------------------------------------------------------------------
+async def test_removed_member_is_pruned(hass: HomeAssistant) -> None:
+    """Members whose state is removed are pruned and reported in one issue."""
+
+    entry = await async_setup_carousel(hass)
+    carousel = hass.data[DATA_CAROUSELS][entry.entry_id]
+    assert carousel.current_entity.entity_id == "sensor.member_0"
+
+    for entity_id in ENTITY_IDS[:4]:
+        hass.states.async_remove(entity_id)
+
+    await hass.async_block_till_done()
+
+    assert list(carousel.missing_entities) == ENTITY_IDS[:4]
+    assert carousel.entities_list.entity_ids() == ["sensor.member_4"]
+    assert carousel.current_entity.entity_id == "sensor.member_4"
+    assert (
+        hass.states.get(carousel.entity_id).attributes["carousel entities visible"] == 1
+    )
+
+    issue = ir.async_get(hass).async_get_issue(
+        DOMAIN, f"{entry.entry_id}_{TRANSLATION_KEY_MISSING_ENTITY}"
+    )
+    assert issue is not None
+    assert issue.translation_placeholders["entity"] == ", ".join(ENTITY_IDS[:4])
+
+
+# ------------------------------------------------------------------
+async def test_returning_member_is_readmitted(hass: HomeAssistant) -> None:
+    """A pruned member is added again when its state returns."""
+
+    entry = await async_setup_carousel(hass)
+    carousel = hass.data[DATA_CAROUSELS][entry.entry_id]
+
+    hass.states.async_remove("sensor.member_2")
+    await hass.async_block_till_done()
+    assert "sensor.member_2" in carousel.missing_entities
+
+    hass.states.async_set("sensor.member_2", "20")
+    await hass.async_block_till_done()
+
+    assert carousel.missing_entities == {}
+    assert "sensor.member_2" in carousel.entities_list.entity_ids()
+    assert (
+        ir.async_get(hass).async_get_issue(
+            DOMAIN, f"{entry.entry_id}_{TRANSLATION_KEY_MISSING_ENTITY}"
+        )
+        is None
+    )
+
+
+# ------------------------------------------------------------------
+async def test_all_members_missing(hass: HomeAssistant, caplog) -> None:
+    """A carousel without any member left refreshes without errors."""
+
+    entry = await async_setup_carousel(hass)
+    carousel = hass.data[DATA_CAROUSELS][entry.entry_id]
+
+    for entity_id in ENTITY_IDS:
+        hass.states.async_remove(entity_id)
+
+    await hass.async_block_till_done()
+
+    await carousel.async_request_refresh()
+    await hass.async_block_till_done()
+
+    assert list(carousel.missing_entities) == ENTITY_IDS
+    assert len(carousel.entities_list) == 0
+    assert carousel.current_entity is None
+    assert "Traceback" not in caplog.text
+
+    hass.states.async_set("sensor.member_3", "30")
+    await hass.async_block_till_done()
+
+    assert carousel.entities_list.entity_ids() == ["sensor.member_3"]
+    assert carousel.current_entity.entity_id == "sensor.member_3"
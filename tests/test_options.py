@@ -0,0 +1,70 @@
+"""Test applying changed options to a running carousel."""
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.carousel.const import DATA_CAROUSELS, DOMAIN
+
+OPTIONS = {
+    "name": "Carousel",
+    "platform_type": "sensor",
+    "entity_ids": ["sensor.member_0", "sensor.member_1"],
+    "rotate_every_minutes": 1,
+    "restart_timer": False,
+}
+
+
+# ------------------------------------------------------------------
+async def test_attribute_options_are_written(hass: HomeAssistant) -> None:
+    """Changing the mirrored attributes writes the state at once."""
+
+    for entity_id in OPTIONS["entity_ids"]:
+        hass.states.async_set(entity_id, "1", {"unit": "W", "secret": "x"})
+
+    entry = MockConfigEntry(domain=DOMAIN, title="Carousel", options=OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    carousel = hass.data[DATA_CAROUSELS][entry.entry_id]
+    assert hass.states.get(carousel.entity_id).attributes["secret"] == "x"
+
+    hass.config_entries.async_update_entry(
+        entry, options={**OPTIONS, "attributes_exclude": ["secret"]}
+    )
+    await hass.async_block_till_done()
+
+    attributes = hass.states.get(carousel.entity_id).attributes
+    assert "secret" not in attributes
+    assert attributes["unit"] == "W"
+
+
+# ------------------------------------------------------------------
+async def test_removed_member_stays_removed(hass: HomeAssistant) -> None:
+    """Saving unrelated options does not add members removed by the service."""
+
+    for entity_id in OPTIONS["entity_ids"]:
+        hass.states.async_set(entity_id, "1")
+
+    entry = MockConfigEntry(domain=DOMAIN, title="Carousel", options=OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    carousel = hass.data[DATA_CAROUSELS][entry.entry_id]
+    await hass.services.async_call(
+        "carousel",
+        "sensor_remove",
+        {"entity_id": carousel.entity_id, "remove_entity_id": "sensor.member_1"},
+        blocking=True,
+    )
+    assert carousel.entities_list.entity_ids() == ["sensor.member_0"]
+
+    hass.config_entries.async_update_entry(
+        entry, options={**OPTIONS, "rotate_every_minutes": 5}
+    )
+    await hass.async_block_till_done()
+
+    assert carousel.entities_list.entity_ids() == ["sensor.member_0"]
+    carousel.update_storage()
+    assert carousel.storage.removed_entity_ids == ["sensor.member_1"]
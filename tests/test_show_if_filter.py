@@ -0,0 +1,130 @@
+"""Test the show if filter."""
+
+import pytest
+
+from homeassistant.core import State
+from homeassistant.helpers.schema_config_entry_flow import SchemaFlowError
+
+from custom_components.carousel.config_flow import _validate_input
+from custom_components.carousel.show_if_filter import (
+    ShowIfFilterError,
+    compile_show_if_filter,
+)
+
+
+# ------------------------------------------------------------------
+def state(value: str, **attributes) -> State:
+    """Member state."""
+    return State("sensor.member", value, attributes)
+
+
+# ------------------------------------------------------------------
+def test_number_value_compares_numbers() -> None:
+    """A number value compares the state as a number."""
+
+    predicate = compile_show_if_filter({"operator": ">", "value": 9})
+
+    assert predicate(state("10"))
+    assert not predicate(state("9"))
+    assert not predicate(state("unavailable"))
+    assert compile_show_if_filter({"operator": "!=", "value": 9})(state("unknown"))
+
+
+# ------------------------------------------------------------------
+def test_text_value_compares_text() -> None:
+    """A text value compares the state as text."""
+
+    assert compile_show_if_filter({"operator": ">", "value": "9"})(state("9a"))
+    assert not compile_show_if_filter({"operator": ">", "value": "9"})(state("10"))
+    assert compile_show_if_filter({"value": "on"})(state("on"))
+    assert compile_show_if_filter({"attribute": "charging", "value": True})(
+        state("1", charging=True)
+    )
+
+
+# ------------------------------------------------------------------
+def test_in_operators() -> None:
+    """in and not in compare with the listed values as text."""
+
+    predicate = compile_show_if_filter(
+        {"operator": "not in", "value": ["unavailable", "unknown"]}
+    )
+    assert predicate(state("20"))
+    assert not predicate(state("unknown"))
+
+    predicate = compile_show_if_filter(
+        {"attribute": "level", "operator": "in", "value": [1, 2]}
+    )
+    assert predicate(state("x", level=2))
+    assert not predicate(state("x", level=3))
+    assert not predicate(state("x"))
+
+
+# ------------------------------------------------------------------
+def test_groups() -> None:
+    """all and any groups nest, and a list is the same as all."""
+
+    predicate = compile_show_if_filter(
+        {
+            "any": [
+                {"operator": ">", "value": 20},
+                {
+                    "all": [
+                        {"attribute": "battery_level", "operator": "<=", "value": 10},
+                        {"attribute": "device_class", "value": "battery"},
+                    ]
+                },
+            ]
+        }
+    )
+    assert predicate(state("21"))
+    assert predicate(state("5", battery_level=10, device_class="battery"))
+    assert not predicate(state("5", battery_level=10, device_class="temperature"))
+    assert not predicate(state("5", battery_level=11, device_class="battery"))
+
+    predicate = compile_show_if_filter(
+        [{"operator": ">", "value": 0}, {"operator": "<", "value": 10}]
+    )
+    assert predicate(state("5"))
+    assert not predicate(state("10"))
+
+
+# ------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "config",
+    [
+        None,
+        {},
+        "state > 20",
+        {"all": []},
+        {"any": {"value": 1}},
+        {"all": [{"value": 1}], "any": [{"value": 2}]},
+        {"operator": ">"},
+        {"value": 1, "entity_id": "sensor.x"},
+        {"operator": "~", "value": 1},
+        {"operator": "in", "value": "on"},
+        {"operator": "<", "value": [1]},
+        {"operator": "==", "value": {"a": 1}},
+        {"operator": ">=", "value": None},
+        {"all": [{"value": 1}, {"operator": "!=", "value": [1]}]},
+    ],
+)
+def test_invalid_filter(config) -> None:
+    """Invalid filters raise the error shown by the config flow."""
+
+    with pytest.raises(ShowIfFilterError):
+        compile_show_if_filter(config)
+
+
+# ------------------------------------------------------------------
+async def test_config_flow_rejects_invalid_filter() -> None:
+    """The config flow reports an invalid filter as a form error."""
+
+    with pytest.raises(SchemaFlowError, match="invalid_show_if_filter"):
+        await _validate_input(
+            None,
+            {
+                "entity_ids": ["sensor.member"],
+                "show_if_filter": {"operator": "<", "value": [1]},
+            },
+        )
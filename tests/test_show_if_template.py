@@ -0,0 +1,54 @@
+"""Test the show if template."""
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.carousel.const import DATA_CAROUSELS, DOMAIN
+
+ENTITY_IDS = [f"sensor.member_{i}" for i in range(3)]
+
+
+# ------------------------------------------------------------------
+async def test_template_reading_other_entities(hass: HomeAssistant) -> None:
+    """Visibility follows the other entities read by the template at once."""
+
+    hass.states.async_set("sensor.limit", "15")
+
+    for i, entity_id in enumerate(ENTITY_IDS):
+        hass.states.async_set(entity_id, str(i * 10))
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Carousel",
+        options={
+            "name": "Carousel",
+            "platform_type": "sensor",
+            "entity_ids": ENTITY_IDS,
+            "rotate_every_minutes": 1,
+            "restart_timer": False,
+            "show_if_template": "{{ state | float > states('sensor.limit') | float }}",
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    carousel = hass.data[DATA_CAROUSELS][entry.entry_id]
+    assert carousel.visible_entity_ids == {"sensor.member_2"}
+    assert carousel.current_entity.entity_id == "sensor.member_2"
+
+    hass.states.async_set("sensor.limit", "5")
+    await hass.async_block_till_done()
+
+    assert carousel.visible_entity_ids == {"sensor.member_1", "sensor.member_2"}
+    assert (
+        hass.states.get(carousel.entity_id).attributes["carousel entities visible"] == 2
+    )
+
+    hass.states.async_set("sensor.limit", "25")
+    await hass.async_block_till_done()
+
+    assert carousel.visible_entity_ids == set()
+    assert (
+        hass.states.get(carousel.entity_id).attributes["carousel entities visible"] == 0
+    )
@@ -0,0 +1,173 @@
+"""Test saving the carousel position."""
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.carousel.carousel_storage import CarouselStorage
+from custom_components.carousel.const import (
+    DATA_CAROUSELS,
+    DOMAIN,
+    STORAGE_SAVE_DELAY,
+)
+
+OPTIONS = {
+    "name": "Carousel",
+    "platform_type": "sensor",
+    "entity_ids": ["sensor.member_0", "sensor.member_1", "sensor.member_2"],
+    "rotate_every_minutes": 1,
+    "restart_timer": False,
+}
+
+
+# ------------------------------------------------------------------
+async def test_position_saved_on_stop(hass: HomeAssistant, hass_storage) -> None:
+    """Rotations do not save the position, stopping Home Assistant does."""
+
+    for entity_id in OPTIONS["entity_ids"]:
+        hass.states.async_set(entity_id, "1")
+
+    entry = MockConfigEntry(domain=DOMAIN, title="Carousel", options=OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    carousel = hass.data[DATA_CAROUSELS][entry.entry_id]
+    key: str = f"{DOMAIN}.{entry.entry_id}"
+
+    await carousel.async_request_refresh()
+    await hass.async_block_till_done()
+    assert carousel.current_entity.entity_id == "sensor.member_1"
+    assert not carousel.storage.save_scheduled___
+    assert key not in hass_storage
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    assert hass_storage[key]["data"]["schema"]["current_entity_id"] == "sensor.member_1"
+
+
+# ------------------------------------------------------------------
+def stored(key: str, data: dict) -> dict:
+    """Mock storage entry."""
+    return {"version": 1, "minor_version": 2, "key": key, "data": data}
+
+
+# ------------------------------------------------------------------
+async def test_journal_of_the_store_generation_applied(
+    hass: HomeAssistant, hass_storage
+) -> None:
+    """A journal is applied to the store of its generation only."""
+
+    schema: dict = {
+        "current_entity_id": "sensor.member_0",
+        "added_entities": [],
+        "removed_entity_ids": [],
+    }
+    hass_storage["carousel.x"] = stored(
+        "carousel.x", {"schema": schema, "journal_generation": 2}
+    )
+    hass_storage["carousel.x.journal"] = stored(
+        "carousel.x.journal",
+        {
+            "journal_generation": 2,
+            "records": 1,
+            "data": {"schema": {"current_entity_id": "sensor.member_1"}},
+        },
+    )
+
+    storage = CarouselStorage(hass, "x")
+    await storage.async_read_settings()
+    assert storage.current_entity_id == "sensor.member_1"
+
+    # A compaction interrupted before the next journal write leaves the
+    # journal of the previous generation behind.
+    storage.journal___.max_records = 1
+    storage.current_entity_id = "sensor.member_2"
+    await storage.async_write_settings()
+    assert hass_storage["carousel.x"]["data"]["journal_generation"] == 3
+    assert hass_storage["carousel.x.journal"]["data"]["journal_generation"] == 2
+
+    storage = CarouselStorage(hass, "x")
+    await storage.async_read_settings()
+    assert storage.current_entity_id == "sensor.member_2"
+
+
+# ------------------------------------------------------------------
+async def test_removed_member_saved(hass: HomeAssistant, hass_storage) -> None:
+    """A member removed by the service is saved without waiting for a stop."""
+
+    for entity_id in OPTIONS["entity_ids"]:
+        hass.states.async_set(entity_id, "1")
+
+    entry = MockConfigEntry(domain=DOMAIN, title="Carousel", options=OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    carousel = hass.data[DATA_CAROUSELS][entry.entry_id]
+    await hass.services.async_call(
+        "carousel",
+        "sensor_remove",
+        {"entity_id": carousel.entity_id, "remove_entity_id": "sensor.member_2"},
+        blocking=True,
+    )
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=STORAGE_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert hass_storage[f"{DOMAIN}.{entry.entry_id}"]["data"]["schema"][
+        "removed_entity_ids"
+    ] == ["sensor.member_2"]
+
+
+# ------------------------------------------------------------------
+async def test_unchanged_data_not_written(hass: HomeAssistant, hass_storage) -> None:
+    """Saves of unchanged data, or of data back at the store, write nothing."""
+
+    schema: dict = {
+        "current_entity_id": "sensor.member_0",
+        "added_entities": [],
+        "removed_entity_ids": [],
+    }
+    hass_storage["carousel.x"] = stored(
+        "carousel.x", {"schema": schema, "journal_generation": 1}
+    )
+
+    storage = CarouselStorage(hass, "x")
+    await storage.async_read_settings()
+
+    storage.async_schedule_save()
+    assert not storage.save_scheduled___
+
+    storage.current_entity_id = "sensor.member_1"
+    storage.async_schedule_save()
+    assert storage.save_scheduled___
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=STORAGE_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+    assert hass_storage["carousel.x.journal"]["data"]["data"]["schema"] == {
+        "current_entity_id": "sensor.member_1"
+    }
+
+    storage.current_entity_id = "sensor.member_0"
+    storage.async_schedule_save()
+    await hass.async_block_till_done()
+    assert not storage.save_scheduled___
+    assert "carousel.x.journal" not in hass_storage
+    assert hass_storage["carousel.x"]["data"]["schema"] == schema
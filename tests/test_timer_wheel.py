@@ -0,0 +1,31 @@
+"""Test the timer wheel."""
+
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.carousel.hass_util import TimerWheel
+
+
+# ------------------------------------------------------------------
+async def test_slots_split_when_short_period_leaves(hass: HomeAssistant) -> None:
+    """Subscribers merged into a shorter period slot get their own slots back."""
+
+    wheel = TimerWheel.async_get(hass)
+
+    unsub_hour = wheel.async_subscribe(timedelta(minutes=60), lambda now: None)
+    unsub_two_hours = wheel.async_subscribe(timedelta(minutes=120), lambda now: None)
+    unsub_minute = wheel.async_subscribe(timedelta(minutes=1), lambda now: None)
+    assert list(wheel.slots) == [60_000]
+    assert len(wheel.slots[60_000].subscribers) == 3
+
+    unsub_minute()
+    assert list(wheel.slots) == [3_600_000]
+    assert len(wheel.slots[3_600_000].subscribers) == 2
+
+    unsub_hour()
+    assert list(wheel.slots) == [7_200_000]
+    assert wheel.slots[7_200_000].subscribers[0].multiple == 1
+
+    unsub_two_hours()
+    assert wheel.slots == {}